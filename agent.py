@@ -3,62 +3,90 @@ LLM-Powered Agentic Scout
 Generates ruthless coaching insights and win condition strategies
 """
 import os
-from typing import Dict, Any, Optional
+import asyncio
+import atexit
+import contextvars
+import functools
+import time
+import hashlib
+from operator import itemgetter
+from typing import Dict, Any, Optional, List, Iterator, Iterable, Union
 import json
 
-
-def generate_scouting_report(stats_dict: Dict[str, Any], game_type: str, llm_provider: str = "openai") -> str:
-    """
-    Generate an AI-powered scouting report using an LLM agent
-    
-    Args:
-        stats_dict: Statistical analysis from the analyzer
-        game_type: "lol" or "valorant"
-        llm_provider: "openai", "gemini", "openrouter", or "mock" for testing
-        
-    Returns:
-        Formatted scouting report with win condition strategy
-    """
-    
-    # Construct the prompt
-    prompt = _build_scout_prompt(stats_dict, game_type)
-    
-    # Call the appropriate LLM
-    if llm_provider == "mock" or not os.getenv("OPENAI_API_KEY"):
-        return _generate_mock_report(stats_dict, game_type)
-    elif llm_provider == "openai":
-        return _call_openai(prompt)
-    elif llm_provider == "gemini":
-        return _call_gemini(prompt)
-    elif llm_provider == "openrouter":
-        return _call_openrouter(prompt)
-    else:
-        raise ValueError(f"Unknown LLM provider: {llm_provider}")
-
-
-def _build_scout_prompt(stats_dict: Dict[str, Any], game_type: str) -> str:
-    """
-    Build the LLM prompt with statistical context
-    
-    Args:
-        stats_dict: Statistical analysis dictionary
-        game_type: "lol" or "valorant"
-        
-    Returns:
-        Formatted prompt string
-    """
-    
-    # Convert stats to formatted JSON for the prompt
-    stats_json = json.dumps(stats_dict, indent=2)
-    
-    if game_type == "lol":
-        prompt = f"""You are a RUTHLESS League of Legends Esports Coach analyzing enemy team data.
+from jsonio import orjson, encode_json, decode_json
+
+# Provider SDKs are imported once here rather than on every call; each caller
+# checks for None and reports the missing package instead
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    from openai import OpenAI, AsyncOpenAI
+except ImportError:
+    OpenAI = AsyncOpenAI = None
+
+# Bounds for every provider call so one hung connection can't stall the pipeline
+LLM_CONNECT_TIMEOUT = 5.0  # seconds
+LLM_READ_TIMEOUT = 20.0  # seconds
+LLM_MAX_RETRIES = 2
+LLM_MAX_OUTPUT_TOKENS = 900  # The report template is ~800 tokens
+
+# Default model served by each provider; callers can pass model= to override
+# (e.g. "google/gemini-flash-1.5" for OpenRouter's paid, latency-optimized tier)
+OPENAI_MODEL = "gpt-4o-mini"
+GEMINI_MODEL = "gemini-pro"
+OPENROUTER_MODEL = "google/gemma-3-27b-it:free"
+_PROVIDER_MODELS = {
+    "openai": OPENAI_MODEL,
+    "gemini": GEMINI_MODEL,
+    "openrouter": OPENROUTER_MODEL
+}
+
+# Larger OpenAI model, reserved for unusually large analyses (see _pick_model)
+OPENAI_COMPLEX_MODEL = "gpt-4-turbo"
+COMPLEX_MATCH_THRESHOLD = 50  # matches analyzed
+
+# Environment variable holding each provider's API key
+_PROVIDER_API_KEYS = {
+    "openai": "OPENAI_API_KEY",
+    "gemini": "GOOGLE_API_KEY",
+    "openrouter": "OPENROUTER_API_KEY"
+}
+
+# OpenRouter connection settings; responses with these statuses are retried
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_BACKOFF = 0.5  # seconds, doubled per attempt
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Explicit API keys for the current call (see generate_scouting_report); None uses the environment
+_API_KEYS = contextvars.ContextVar("api_keys", default=None)
+
+# Shared AsyncClient for the duration of a scout_teams_batch run
+_OPENROUTER_ASYNC_CLIENT = contextvars.ContextVar("openrouter_async_client", default=None)
+
+# AsyncOpenAI clients shared for the duration of a scout_teams_batch run: api_key -> client
+_OPENAI_ASYNC_CLIENTS = contextvars.ContextVar("openai_async_clients", default=None)
+
+# On-disk cache of generated reports, so identical stats never hit the LLM twice;
+# anchored next to this module so a server restarted from another directory still finds it
+REPORT_CACHE_DIR = os.getenv("SCOUT_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".scout_cache"))
+REPORT_CACHE_TTL = 86400  # seconds
+
+# Multi-team requests: several teams' stats share one prompt and one response
+REPORT_DELIMITER = "===REPORT==="
+BATCH_MAX_TEAMS = 4
+BATCH_MAX_INPUT_TOKENS = 8000  # Rough budget, estimated at ~4 characters per token
+
+# Static prompt scaffolding. Each prefix is sent verbatim ahead of the stats JSON,
+# so providers' prefix (KV/prompt) caches can reuse it across calls: never format,
+# strip or otherwise mutate these strings per request.
+_LOL_VERBOSE_PROMPT_PREFIX = """You are a RUTHLESS League of Legends Esports Coach analyzing enemy team data.
 
 Your job is to find EXPLOITABLE WEAKNESSES and craft a precise win condition.
 
-TEAM STATISTICS:
-{stats_json}
-
 ANALYSIS REQUIREMENTS:
 
 1. PATTERN RECOGNITION
@@ -109,14 +137,10 @@ FORMAT YOUR RESPONSE AS:
 
 Be DIRECT. Be RUTHLESS. Be ACTIONABLE."""
 
-    else:  # VALORANT
-        prompt = f"""You are a RUTHLESS VALORANT Esports Coach analyzing enemy team data.
+_VALORANT_VERBOSE_PROMPT_PREFIX = """You are a RUTHLESS VALORANT Esports Coach analyzing enemy team data.
 
 Your job is to find EXPLOITABLE WEAKNESSES and craft a precise win condition.
 
-TEAM STATISTICS:
-{stats_json}
-
 ANALYSIS REQUIREMENTS:
 
 1. PATTERN RECOGNITION
@@ -167,192 +191,1022 @@ FORMAT YOUR RESPONSE AS:
 
 Be DIRECT. Be RUTHLESS. Be ACTIONABLE."""
 
-    return prompt
+# Compact variants: the same report headings, a single analysis instruction line
+_LOL_PROMPT_PREFIX = """You are a RUTHLESS League of Legends Esports Coach. Find this enemy team's EXPLOITABLE WEAKNESSES.
+
+Cover patterns, jungle pathing, objective control and gold scaling, then THE WIN CONDITION: biggest weakness, counter-strategy, exact timing window, lanes/players to pressure.
+
+Respond in this format:
+## 🎯 SCOUTING REPORT: [Team Name]
+### 📊 Key Patterns
+### 🌲 Jungle Pressure Map
+### 🐉 Objective Control Assessment
+### 💰 Economic Trends
+### 🚨 THE WIN CONDITION
+**Their Fatal Flaw:**
+**Our Counter-Strategy:**
+**Timing Window:**
+**Target Priority:**
+
+Be DIRECT, RUTHLESS and ACTIONABLE."""
+
+_VALORANT_PROMPT_PREFIX = """You are a RUTHLESS VALORANT Esports Coach. Find this enemy team's EXPLOITABLE WEAKNESSES.
+
+Cover patterns, opening duels, site bias and economy, then THE WIN CONDITION: biggest weakness, counter-strategy, map areas to exploit, vulnerable round types (Eco/Force/Full).
+
+Respond in this format:
+## 🎯 SCOUTING REPORT: [Team Name]
+### 📊 Key Patterns
+### ⚔️ Opening Engagement Analysis
+### 🗺️ Site Attack Tendencies
+### 💳 Economic Discipline
+### 🚨 THE WIN CONDITION
+**Their Fatal Flaw:**
+**Our Counter-Strategy:**
+**Map Control Focus:**
+**Round Type Exploit:**
+
+Be DIRECT, RUTHLESS and ACTIONABLE."""
+
+# Dynamic tail appended after the static prefix
+_PROMPT_STATS_SUFFIX = "\n\nTEAM STATISTICS (JSON):\n{stats_json}\n\nProduce the report now."
+
+_PROMPT_PREFIXES = {
+    "lol": _LOL_PROMPT_PREFIX,
+    "valorant": _VALORANT_PROMPT_PREFIX
+}
+_VERBOSE_PROMPT_PREFIXES = {
+    "lol": _LOL_VERBOSE_PROMPT_PREFIX,
+    "valorant": _VALORANT_VERBOSE_PROMPT_PREFIX
+}
+
+def generate_scouting_report(stats_dict: Dict[str, Any], game_type: str, llm_provider: str = "openai",
+                             stream: bool = False, verbose_prompt: bool = False,
+                             model: Optional[str] = None,
+                             api_keys: Optional[Dict[str, str]] = None) -> Union[str, Iterator[str]]:
+    """
+    Generate an AI-powered scouting report using an LLM agent
+    
+    Args:
+        stats_dict: Statistical analysis from the analyzer
+        game_type: "lol" or "valorant"
+        llm_provider: "openai", "gemini", "openrouter", or "mock" for testing
+        stream: Yield the report in chunks as the LLM produces them
+        verbose_prompt: Send the original long-form prompt instead of the compact one
+        model: Model override; by default picked from the stats (see _pick_model)
+        api_keys: Provider name -> API key for this call only; providers missing
+            from it fall back to their environment variable
+        
+    Returns:
+        Formatted scouting report with win condition strategy, or an
+        iterator of report chunks when stream is True (see collect())
+    """
+    if api_keys is None:
+        return _generate_report(stats_dict, game_type, llm_provider, stream, verbose_prompt, model)
+    
+    # Scope the keys to this call; a streamed report keeps them while it is consumed
+    ctx = contextvars.copy_context()
+    ctx.run(_API_KEYS.set, api_keys)
+    report = ctx.run(_generate_report, stats_dict, game_type, llm_provider, stream, verbose_prompt, model)
+    return _iter_in_context(ctx, report) if stream else report
+
+
+def _generate_report(stats_dict: Dict[str, Any], game_type: str, llm_provider: str,
+                     stream: bool, verbose_prompt: bool, model: Optional[str]) -> Union[str, Iterator[str]]:
+    """Body of generate_scouting_report, run with the call's API keys in context"""
+    if llm_provider != "mock" and llm_provider not in _PROVIDERS:
+        raise ValueError(f"Unknown LLM provider: {llm_provider}")
+    
+    # Without the chosen provider's API key, fall back to the mock report
+    if llm_provider == "mock" or not _provider_api_key(llm_provider):
+        report = _generate_mock_report(stats_dict, game_type)
+        return iter([report]) if stream else report
+    
+    model = model or _pick_model(stats_dict, game_type, llm_provider)
+    
+    # Identical stats for the same provider/model reuse the earlier report
+    cache_key = _report_cache_key(stats_dict, game_type, llm_provider, verbose_prompt, model)
+    cached_report = _load_cached_report(cache_key)
+    if cached_report is not None:
+        return iter([cached_report]) if stream else cached_report
+    
+    # Construct the prompt
+    prompt = _build_scout_prompt(stats_dict, game_type, verbose_prompt)
+    
+    # Call the appropriate LLM
+    if stream:
+        return _cache_stream(_STREAM_PROVIDERS[llm_provider](prompt, model=model), cache_key)
+    
+    report = _PROVIDERS[llm_provider](prompt, model=model)
+    _store_report(cache_key, report)
+    return report
+
+
+def collect(report: Union[str, Iterable[str]]) -> str:
+    """
+    Join a streamed report back into a single string
+    
+    Args:
+        report: Report string or iterator of chunks from generate_scouting_report
+        
+    Returns:
+        Complete report text
+    """
+    if isinstance(report, str):
+        return report
+    return "".join(report)
+
+
+async def generate_scouting_report_async(stats_dict: Dict[str, Any], game_type: str, llm_provider: str = "openai",
+                                         verbose_prompt: bool = False, model: Optional[str] = None,
+                                         api_keys: Optional[Dict[str, str]] = None) -> str:
+    """
+    Async variant of generate_scouting_report using the providers' async clients
+    
+    Providers without an async client, and the blocking disk-cache lookups,
+    run in a worker thread so the event loop stays free during the LLM wait.
+    Native async clients are preferred under load since they don't consume
+    threads. Web handlers that want incremental output can instead wrap the
+    stream=True iterator of generate_scouting_report in a server-sent events
+    response (e.g. FastAPI's StreamingResponse with media_type="text/event-stream").
+    
+    Args:
+        stats_dict: Statistical analysis from the analyzer
+        game_type: "lol" or "valorant"
+        llm_provider: "openai", "gemini", "openrouter", or "mock" for testing
+        verbose_prompt: Send the original long-form prompt instead of the compact one
+        model: Model override; by default picked from the stats (see _pick_model)
+        api_keys: Provider name -> API key for this call only; providers missing
+            from it fall back to their environment variable
+        
+    Returns:
+        Formatted scouting report with win condition strategy
+    """
+    if api_keys is None:
+        return await _generate_report_async(stats_dict, game_type, llm_provider, verbose_prompt, model)
+    
+    # Scope the keys to this call; awaiting directly runs in the caller's context
+    token = _API_KEYS.set(api_keys)
+    try:
+        return await _generate_report_async(stats_dict, game_type, llm_provider, verbose_prompt, model)
+    finally:
+        _API_KEYS.reset(token)
+
+
+async def _generate_report_async(stats_dict: Dict[str, Any], game_type: str, llm_provider: str,
+                                 verbose_prompt: bool, model: Optional[str]) -> str:
+    """Body of generate_scouting_report_async, run with the call's API keys in context"""
+    if llm_provider != "mock" and llm_provider not in _PROVIDERS:
+        raise ValueError(f"Unknown LLM provider: {llm_provider}")
+    
+    if llm_provider == "mock" or not _provider_api_key(llm_provider):
+        return _generate_mock_report(stats_dict, game_type)
+    
+    model = model or _pick_model(stats_dict, game_type, llm_provider)
+    cache_key = _report_cache_key(stats_dict, game_type, llm_provider, verbose_prompt, model)
+    cached_report = await asyncio.to_thread(_load_cached_report, cache_key)
+    if cached_report is not None:
+        return cached_report
+    
+    prompt = _build_scout_prompt(stats_dict, game_type, verbose_prompt)
+    
+    async_call = _ASYNC_PROVIDERS.get(llm_provider)
+    if async_call is not None:
+        report = await async_call(prompt, model=model)
+    else:
+        report = await asyncio.to_thread(_PROVIDERS[llm_provider], prompt, model=model)
+    
+    await asyncio.to_thread(_store_report, cache_key, report)
+    return report
+
+
+def _provider_api_key(llm_provider: str) -> Optional[str]:
+    """Return the provider's API key from the call's explicit keys, else the environment"""
+    api_keys = _API_KEYS.get()
+    if api_keys and api_keys.get(llm_provider):
+        return api_keys[llm_provider]
+    return os.getenv(_PROVIDER_API_KEYS[llm_provider])
 
 
-def _call_openai(prompt: str) -> str:
+def _iter_in_context(ctx: contextvars.Context, chunks: Iterator[str]) -> Iterator[str]:
+    """Advance a streamed report inside ctx so lazy provider calls see its API keys"""
+    while True:
+        try:
+            yield ctx.run(next, chunks)
+        except StopIteration:
+            return
+
+
+def _pick_model(stats_dict: Dict[str, Any], game_type: str, llm_provider: str) -> str:
+    """
+    Route a request to the cheapest model that handles it well
+    
+    The report is template-driven, so the small default model covers typical
+    scouting runs; OpenAI requests only escalate to the larger model for
+    unusually big analyses.
+    
+    Args:
+        stats_dict: Statistical analysis dictionary
+        game_type: "lol" or "valorant"
+        llm_provider: "openai", "gemini" or "openrouter"
+        
+    Returns:
+        Model name for the provider
+    """
+    if llm_provider == "openai" and stats_dict.get("matches_analyzed", 0) > COMPLEX_MATCH_THRESHOLD:
+        return OPENAI_COMPLEX_MODEL
+    
+    return _PROVIDER_MODELS[llm_provider]
+
+
+@functools.lru_cache(maxsize=1)
+def _get_report_cache():
+    """
+    Open the on-disk report cache
+    
+    Returns:
+        diskcache.Cache instance, or None when diskcache is not installed
+    """
+    try:
+        import diskcache
+    except ImportError:
+        return None
+    
+    return diskcache.Cache(REPORT_CACHE_DIR)
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize NumPy scalars/arrays that analyzers may leave in stats"""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _report_cache_key(stats_dict: Dict[str, Any], game_type: str, llm_provider: str,
+                      verbose_prompt: bool = False, model: Optional[str] = None) -> str:
+    """
+    Build a stable cache key for a report request
+    
+    Args:
+        stats_dict: Statistical analysis dictionary
+        game_type: "lol" or "valorant"
+        llm_provider: Provider the report is generated with
+        verbose_prompt: Whether the long-form prompt is used
+        model: Model the report is generated with (defaults to the provider's)
+        
+    Returns:
+        Hex digest identifying (game, provider, model, prompt variant, stats)
+    """
+    canonical_stats = json.dumps(stats_dict, sort_keys=True, separators=(",", ":"), default=_json_default)
+    prompt_variant = "verbose" if verbose_prompt else "compact"
+    digest = hashlib.blake2b(digest_size=20)
+    model = model or _PROVIDER_MODELS[llm_provider]
+    for part in (game_type, llm_provider, model, prompt_variant, canonical_stats):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _load_cached_report(cache_key: str) -> Optional[str]:
+    """Return a previously generated report, or None on a miss"""
+    cache = _get_report_cache()
+    if cache is None:
+        return None
+    
+    try:
+        return cache.get(cache_key)
+    except Exception:
+        return None
+
+
+def _store_report(cache_key: str, report: str) -> None:
+    """Persist a generated report; text carrying a provider error is never cached"""
+    cache = _get_report_cache()
+    if cache is None or not report or "⚠️ ERROR" in report:
+        return
+    
+    try:
+        cache.set(cache_key, report, expire=REPORT_CACHE_TTL)
+    except Exception:
+        pass
+
+
+class _StreamError(str):
+    """Chunk with which a stream provider reports a failed call; such a stream is never cached"""
+
+
+def _cache_stream(chunks: Iterable[str], cache_key: str) -> Iterator[str]:
+    """Pass a report stream through, caching the full text once it completes cleanly"""
+    parts = []
+    failed = False
+    for chunk in chunks:
+        failed = failed or isinstance(chunk, _StreamError)
+        parts.append(chunk)
+        yield chunk
+    
+    # Only reached when the provider ran to the end; a raising or abandoned stream stops above
+    if not failed:
+        _store_report(cache_key, "".join(parts))
+
+
+def _build_scout_prompt(stats_dict: Dict[str, Any], game_type: str, verbose_prompt: bool = False) -> str:
+    """
+    Build the LLM prompt with statistical context
+    
+    The static instructions come first and the stats JSON last, so every call
+    for a game_type shares a byte-identical prefix that the provider can cache.
+    
+    Args:
+        stats_dict: Statistical analysis dictionary
+        game_type: "lol" or "valorant"
+        verbose_prompt: Use the original long-form prompt with indented JSON
+        
+    Returns:
+        Formatted prompt string
+    """
+    
+    if verbose_prompt:
+        # Convert stats to formatted JSON for the prompt
+        if orjson is not None:
+            stats_json = orjson.dumps(
+                stats_dict,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ).decode()
+        else:
+            stats_json = json.dumps(stats_dict, indent=2, default=_json_default)
+        
+        prefix = _VERBOSE_PROMPT_PREFIXES.get(game_type, _VALORANT_VERBOSE_PROMPT_PREFIX)
+        return prefix + _PROMPT_STATS_SUFFIX.format(stats_json=stats_json)
+    
+    stats_json = _compact_stats_json(stats_dict)
+    prefix = _PROMPT_PREFIXES.get(game_type, _VALORANT_PROMPT_PREFIX)
+    return prefix + _PROMPT_STATS_SUFFIX.format(stats_json=stats_json)
+
+
+def _compact_stats_json(stats_dict: Dict[str, Any]) -> str:
+    """
+    Serialize stats for the compact prompt
+    
+    Args:
+        stats_dict: Statistical analysis dictionary
+        
+    Returns:
+        Minified JSON string
+    """
+    # Compact JSON without the raw heatmap samples: every indent, newline and
+    # coordinate is an input token, and the lane percentages already summarize them
+    prompt_stats = stats_dict
+    jungle_data = stats_dict.get("jungle_proximity")
+    if isinstance(jungle_data, dict) and "heatmap_data" in jungle_data:
+        prompt_stats = {
+            **stats_dict,
+            "jungle_proximity": {key: value for key, value in jungle_data.items() if key != "heatmap_data"}
+        }
+    
+    if orjson is not None:
+        return orjson.dumps(prompt_stats, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(prompt_stats, separators=(",", ":"), default=_json_default)
+
+
+def _build_batch_prompt(stats_jsons: List[str], game_type: str) -> str:
+    """
+    Build one prompt asking for a report per team
+    
+    Args:
+        stats_jsons: Compact stats JSON, one per team
+        game_type: "lol" or "valorant"
+        
+    Returns:
+        Prompt sharing the single-team static prefix
+    """
+    prefix = _PROMPT_PREFIXES.get(game_type, _VALORANT_PROMPT_PREFIX)
+    teams = "\n---\n".join(
+        f"TEAM {index} STATISTICS (JSON):\n{stats_json}"
+        for index, stats_json in enumerate(stats_jsons, start=1)
+    )
+    return (
+        f"{prefix}\n\n{teams}\n\n"
+        f"Produce one report per team, in the order given, separated by a line containing only {REPORT_DELIMITER}"
+    )
+
+
+def _estimate_tokens(text: str) -> int:
+    """Cheap input-token estimate (~4 characters per token for English/JSON)"""
+    return len(text) // 4 + 1
+
+
+@functools.lru_cache(maxsize=1)
+def _import_glm():
+    """
+    Import the Gemini API client library on first use; it is slow to load and
+    only one provider needs it
+    
+    The google-generativeai package installs it. Its own genai.configure()
+    sets one API key for the whole process, so the Gemini calls here build
+    per-key clients from the underlying library instead.
+    
+    Returns:
+        google.ai.generativelanguage module, or None when it is not installed
+    """
+    try:
+        import google.ai.generativelanguage as glm
+    except ImportError:
+        return None
+    return glm
+
+
+@functools.lru_cache(maxsize=4)
+def _get_gemini_client(api_key: str):
+    """
+    Build (once per key) the Gemini client, so concurrent calls with different
+    keys never share credentials
+    
+    Args:
+        api_key: Google API key
+    
+    Returns:
+        GenerativeServiceClient authenticated with api_key
+    """
+    return _import_glm().GenerativeServiceClient(client_options={"api_key": api_key})
+
+
+def _gemini_request(prompt: str, model: str, max_tokens: int = LLM_MAX_OUTPUT_TOKENS):
+    """Build a single-turn Gemini request for a prompt"""
+    glm = _import_glm()
+    return glm.GenerateContentRequest(
+        model=model if model.startswith("models/") else f"models/{model}",
+        contents=[glm.Content(role="user", parts=[glm.Part(text=prompt)])],
+        generation_config=glm.GenerationConfig(max_output_tokens=max_tokens)
+    )
+
+
+def _gemini_text(response) -> str:
+    """Join the text parts of a Gemini response's first candidate ("" when it has none)"""
+    if not response.candidates:
+        return ""
+    return "".join(part.text for part in response.candidates[0].content.parts)
+
+
+def _new_openai_async_client(api_key: str):
+    """Build an AsyncOpenAI client; like the OpenRouter one, it is tied to its event loop"""
+    return AsyncOpenAI(
+        api_key=api_key,
+        timeout=httpx.Timeout(LLM_READ_TIMEOUT, connect=LLM_CONNECT_TIMEOUT),
+        max_retries=LLM_MAX_RETRIES
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _get_openai_client(api_key: str):
+    """
+    Build (once per key) the OpenAI client, so its connection pool is reused
+    
+    Args:
+        api_key: OpenAI API key
+        
+    Returns:
+        openai.OpenAI client with bounded timeouts and retries
+    """
+    return OpenAI(
+        api_key=api_key,
+        timeout=httpx.Timeout(LLM_READ_TIMEOUT, connect=LLM_CONNECT_TIMEOUT),
+        max_retries=LLM_MAX_RETRIES
+    )
+
+
+def _call_openai(prompt: str, max_tokens: int = LLM_MAX_OUTPUT_TOKENS,
+                 model: str = OPENAI_MODEL) -> str:
     """
     Call OpenAI API for report generation
     
     Args:
         prompt: The constructed prompt
+        max_tokens: Output token limit for the response
+        model: Model to request
         
     Returns:
         LLM-generated scouting report
     """
+    if OpenAI is None:
+        return "⚠️ ERROR: openai package not installed. Run: pip install openai"
+    
     try:
-        from openai import OpenAI
-        
-        api_key = os.getenv("OPENAI_API_KEY")
+        api_key = _provider_api_key("openai")
         if not api_key:
             return "⚠️ ERROR: OPENAI_API_KEY not found in environment variables. Using mock report."
         
-        client = OpenAI(api_key=api_key)
+        client = _get_openai_client(api_key)
         
         response = client.chat.completions.create(
-            model="gpt-4-turbo-preview",
-            messages=[
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7
+            model=model,
+            messages=_user_msg(prompt),
+            temperature=0.7,
+            max_tokens=max_tokens
         )
         
         return response.choices[0].message.content
     
-    except ImportError:
-        return "⚠️ ERROR: openai package not installed. Run: pip install openai"
     except Exception as e:
         return f"⚠️ ERROR calling OpenAI: {str(e)}\n\nUsing mock report instead."
 
 
-def _call_gemini(prompt: str) -> str:
+def _call_gemini(prompt: str, max_tokens: int = LLM_MAX_OUTPUT_TOKENS,
+                 model: str = GEMINI_MODEL) -> str:
     """
     Call Google Gemini API for report generation
     
     Args:
         prompt: The constructed prompt
+        max_tokens: Output token limit for the response
+        model: Model to request
         
     Returns:
         LLM-generated scouting report
     """
+    glm = _import_glm()
+    if glm is None:
+        return "⚠️ ERROR: google-generativeai not installed. Run: pip install google-generativeai"
+    
     try:
-        import google.generativeai as genai
-        
-        api_key = os.getenv("GOOGLE_API_KEY")
+        api_key = _provider_api_key("gemini")
         if not api_key:
             return "⚠️ ERROR: GOOGLE_API_KEY not found in environment variables. Using mock report."
         
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-pro')
-        
-        response = model.generate_content(prompt)
-        return response.text
+        response = _get_gemini_client(api_key).generate_content(
+            _gemini_request(prompt, model, max_tokens),
+            timeout=LLM_READ_TIMEOUT
+        )
+        text = _gemini_text(response)
+        if not text:
+            raise ValueError("no text in the response; the prompt or reply may have been blocked")
+        return text
     
-    except ImportError:
-        return "⚠️ ERROR: google-generativeai not installed. Run: pip install google-generativeai"
     except Exception as e:
         return f"⚠️ ERROR calling Gemini: {str(e)}\n\nUsing mock report instead."
 
 
-def _call_openrouter(prompt: str) -> str:
+@functools.lru_cache(maxsize=1)
+def _http2_available() -> bool:
+    """Check whether httpx can negotiate HTTP/2 (needs the optional h2 package)"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _openrouter_transport_kwargs() -> Dict[str, Any]:
+    """Connection settings shared by the sync and async OpenRouter clients"""
+    return {
+        "http2": _http2_available(),
+        "retries": LLM_MAX_RETRIES,
+        "limits": httpx.Limits(max_keepalive_connections=20)
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _get_openrouter_client():
+    """
+    Build the shared OpenRouter client
+    
+    Keep-alive (and HTTP/2 when available) amortizes the TCP/TLS handshake
+    across every call made by this process.
+    
+    Returns:
+        httpx.Client bound to the OpenRouter API
+    """
+    client = httpx.Client(
+        base_url=OPENROUTER_BASE_URL,
+        timeout=httpx.Timeout(LLM_READ_TIMEOUT, connect=LLM_CONNECT_TIMEOUT),
+        transport=httpx.HTTPTransport(**_openrouter_transport_kwargs())
+    )
+    atexit.register(client.close)
+    return client
+
+
+def _new_openrouter_async_client():
+    """Build an OpenRouter AsyncClient; async clients are tied to their event loop"""
+    return httpx.AsyncClient(
+        base_url=OPENROUTER_BASE_URL,
+        timeout=httpx.Timeout(LLM_READ_TIMEOUT, connect=LLM_CONNECT_TIMEOUT),
+        transport=httpx.AsyncHTTPTransport(**_openrouter_transport_kwargs())
+    )
+
+
+def _user_msg(prompt: str) -> tuple:
+    """Single-turn chat messages for a prompt"""
+    return ({"role": "user", "content": prompt},)
+
+
+@functools.lru_cache(maxsize=4)
+def _openrouter_headers(api_key: str) -> Dict[str, str]:
+    """Request headers for an API key, built once per key (never mutate the result)"""
+    return {**_JSON_HEADERS, "Authorization": f"Bearer {api_key}"}
+
+
+def _send_openrouter(api_key: str, body: Dict[str, Any], stream: bool = False):
+    """
+    POST a chat completion to OpenRouter, retrying rate limits and server errors
+    
+    Args:
+        api_key: OpenRouter API key
+        body: Chat completion request body
+        stream: Leave the response body unread so it can be iterated
+        
+    Returns:
+        Successful httpx.Response (the caller closes it when streaming)
+    """
+    client = _get_openrouter_client()
+    content = encode_json(body)
+    
+    for attempt in range(LLM_MAX_RETRIES + 1):
+        request = client.build_request(
+            "POST",
+            "/chat/completions",
+            headers=_openrouter_headers(api_key),
+            content=content
+        )
+        response = client.send(request, stream=stream)
+        if response.status_code not in _RETRY_STATUSES or attempt == LLM_MAX_RETRIES:
+            break
+        
+        response.close()
+        time.sleep(_RETRY_BACKOFF * 2 ** attempt)
+    
+    if response.is_error:
+        response.read()
+        response.close()
+    response.raise_for_status()
+    return response
+
+
+async def _send_openrouter_async(client, api_key: str, body: Dict[str, Any]):
+    """Async counterpart of _send_openrouter for a buffered response"""
+    content = encode_json(body)
+    
+    for attempt in range(LLM_MAX_RETRIES + 1):
+        response = await client.post(
+            "/chat/completions",
+            headers=_openrouter_headers(api_key),
+            content=content
+        )
+        if response.status_code not in _RETRY_STATUSES or attempt == LLM_MAX_RETRIES:
+            break
+        
+        await asyncio.sleep(_RETRY_BACKOFF * 2 ** attempt)
+    
+    response.raise_for_status()
+    return response
+
+
+def _call_openrouter(prompt: str, max_tokens: int = LLM_MAX_OUTPUT_TOKENS,
+                     model: str = OPENROUTER_MODEL) -> str:
     """
     Call OpenRouter API (Google Gemma 3 27B free tier)
     
     Args:
         prompt: The constructed prompt
+        max_tokens: Output token limit for the response
+        model: Model to request
         
     Returns:
         LLM-generated scouting report
     """
+    if httpx is None:
+        return "⚠️ ERROR: httpx not installed. Run: pip install httpx"
+    
     try:
-        import requests
-        
-        api_key = os.getenv("OPENROUTER_API_KEY")
+        api_key = _provider_api_key("openrouter")
         if not api_key:
             return "⚠️ ERROR: OPENROUTER_API_KEY not found in environment variables. Using mock report."
         
-        response = requests.post(
-            "https://openrouter.ai/api/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json"
-            },
-            json={
-                "model": "google/gemma-3-27b-it:free",
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            },
-            timeout=30
-        )
-        response.raise_for_status()
-        data = response.json()
+        response = _send_openrouter(api_key, {
+            "model": model,
+            "messages": _user_msg(prompt),
+            "max_tokens": max_tokens
+        })
+        data = decode_json(response.content)
         
         return data["choices"][0]["message"]["content"]
     
-    except ImportError:
-        return "⚠️ ERROR: requests not installed. Run: pip install requests"
     except Exception as e:
         return f"⚠️ ERROR calling OpenRouter: {str(e)}\n\nUsing mock report instead."
 
 
-def _generate_mock_report(stats_dict: Dict[str, Any], game_type: str) -> str:
+def _call_openai_stream(prompt: str, model: str = OPENAI_MODEL) -> Iterator[str]:
     """
-    Generate a mock scouting report for testing without LLM API
+    Stream an OpenAI completion chunk by chunk
     
     Args:
-        stats_dict: Statistical analysis dictionary
-        game_type: "lol" or "valorant"
+        prompt: The constructed prompt
+        model: Model to request
+        
+    Yields:
+        Pieces of the LLM-generated scouting report; a failed call ends with a
+        _StreamError chunk
+    """
+    if OpenAI is None:
+        yield _StreamError("⚠️ ERROR: openai package not installed. Run: pip install openai")
+        return
+    
+    try:
+        api_key = _provider_api_key("openai")
+        if not api_key:
+            yield _StreamError("⚠️ ERROR: OPENAI_API_KEY not found in environment variables. Using mock report.")
+            return
+        
+        client = _get_openai_client(api_key)
+        
+        response = client.chat.completions.create(
+            model=model,
+            messages=_user_msg(prompt),
+            temperature=0.7,
+            max_tokens=LLM_MAX_OUTPUT_TOKENS,
+            stream=True
+        )
+        
+        for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    
+    except Exception as e:
+        yield _StreamError(f"⚠️ ERROR calling OpenAI: {str(e)}\n\nUsing mock report instead.")
+
+
+def _call_gemini_stream(prompt: str, model: str = GEMINI_MODEL) -> Iterator[str]:
+    """
+    Stream a Google Gemini completion chunk by chunk
+    
+    Args:
+        prompt: The constructed prompt
+        model: Model to request
+        
+    Yields:
+        Pieces of the LLM-generated scouting report; a failed call ends with a
+        _StreamError chunk
+    """
+    glm = _import_glm()
+    if glm is None:
+        yield _StreamError("⚠️ ERROR: google-generativeai not installed. Run: pip install google-generativeai")
+        return
+    
+    try:
+        api_key = _provider_api_key("gemini")
+        if not api_key:
+            yield _StreamError("⚠️ ERROR: GOOGLE_API_KEY not found in environment variables. Using mock report.")
+            return
+        
+        response = _get_gemini_client(api_key).stream_generate_content(
+            _gemini_request(prompt, model),
+            timeout=LLM_READ_TIMEOUT
+        )
+        
+        for chunk in response:
+            text = _gemini_text(chunk)
+            if text:
+                yield text
+    
+    except Exception as e:
+        yield _StreamError(f"⚠️ ERROR calling Gemini: {str(e)}\n\nUsing mock report instead.")
+
+
+def _call_openrouter_stream(prompt: str, model: str = OPENROUTER_MODEL) -> Iterator[str]:
+    """
+    Stream an OpenRouter completion via server-sent events
+    
+    Args:
+        prompt: The constructed prompt
+        model: Model to request
+        
+    Yields:
+        Pieces of the LLM-generated scouting report; a failed call ends with a
+        _StreamError chunk
+    """
+    if httpx is None:
+        yield _StreamError("⚠️ ERROR: httpx not installed. Run: pip install httpx")
+        return
+    
+    try:
+        api_key = _provider_api_key("openrouter")
+        if not api_key:
+            yield _StreamError("⚠️ ERROR: OPENROUTER_API_KEY not found in environment variables. Using mock report.")
+            return
+        
+        response = _send_openrouter(api_key, {
+            "model": model,
+            "messages": _user_msg(prompt),
+            "max_tokens": LLM_MAX_OUTPUT_TOKENS,
+            "stream": True
+        }, stream=True)
+        
+        try:
+            for line in response.iter_lines():
+                # Skip keep-alive comments (": OPENROUTER PROCESSING") and blank lines
+                if not line or not line.startswith("data: "):
+                    continue
+                
+                payload = line[len("data: "):]
+                if payload == "[DONE]":
+                    break
+                
+                content = decode_json(payload)["choices"][0]["delta"].get("content")
+                if content:
+                    yield content
+        finally:
+            response.close()
+    
+    except Exception as e:
+        yield _StreamError(f"⚠️ ERROR calling OpenRouter: {str(e)}\n\nUsing mock report instead.")
+
+
+async def _send_openai_async(client, prompt: str, model: str):
+    """Request a chat completion for a prompt on an AsyncOpenAI client"""
+    return await client.chat.completions.create(
+        model=model,
+        messages=_user_msg(prompt),
+        temperature=0.7,
+        max_tokens=LLM_MAX_OUTPUT_TOKENS
+    )
+
+
+async def _call_openai_async(prompt: str, model: str = OPENAI_MODEL) -> str:
+    """
+    Call OpenAI API without blocking the event loop
+    
+    Args:
+        prompt: The constructed prompt
+        model: Model to request
         
     Returns:
-        Mock scouting report
+        LLM-generated scouting report
     """
+    if AsyncOpenAI is None:
+        return "⚠️ ERROR: openai package not installed. Run: pip install openai"
     
-    team_name = stats_dict.get("team_name", "Unknown Team")
+    try:
+        api_key = _provider_api_key("openai")
+        if not api_key:
+            return "⚠️ ERROR: OPENAI_API_KEY not found in environment variables. Using mock report."
+        
+        # Reuse the batch's client for this key when one is active
+        clients = _OPENAI_ASYNC_CLIENTS.get()
+        if clients is not None:
+            client = clients.get(api_key)
+            if client is None:
+                client = clients[api_key] = _new_openai_async_client(api_key)
+            response = await _send_openai_async(client, prompt, model)
+        else:
+            async with _new_openai_async_client(api_key) as client:
+                response = await _send_openai_async(client, prompt, model)
+        
+        return response.choices[0].message.content
     
-    if game_type == "lol":
-        jungle_data = stats_dict.get("jungle_proximity", {})
-        objective_data = stats_dict.get("objective_control", {})
-        gold_data = stats_dict.get("gold_efficiency", {})
+    except Exception as e:
+        return f"⚠️ ERROR calling OpenAI: {str(e)}\n\nUsing mock report instead."
+
+
+async def _call_gemini_async(prompt: str, model: str = GEMINI_MODEL) -> str:
+    """
+    Call Google Gemini API without blocking the event loop
+    
+    Args:
+        prompt: The constructed prompt
+        model: Model to request
         
-        weakest_lane = min(
-            [("Top", jungle_data.get("top_lane_percent", 0)),
-             ("Mid", jungle_data.get("mid_lane_percent", 0)),
-             ("Bot", jungle_data.get("bot_lane_percent", 0))],
-            key=lambda x: x[1]
-        )[0]
+    Returns:
+        LLM-generated scouting report
+    """
+    glm = _import_glm()
+    if glm is None:
+        return "⚠️ ERROR: google-generativeai not installed. Run: pip install google-generativeai"
+    
+    try:
+        api_key = _provider_api_key("gemini")
+        if not api_key:
+            return "⚠️ ERROR: GOOGLE_API_KEY not found in environment variables. Using mock report."
         
-        first_dragon_rate = objective_data.get("first_dragon_rate", 0)
-        gold_at_15 = gold_data.get("gold_diff_at_15min", 0)
+        # Async clients are tied to their event loop, so each call gets its own
+        client = glm.GenerativeServiceAsyncClient(client_options={"api_key": api_key})
+        try:
+            response = await client.generate_content(_gemini_request(prompt, model), timeout=LLM_READ_TIMEOUT)
+        finally:
+            await client.transport.close()
+        text = _gemini_text(response)
+        if not text:
+            raise ValueError("no text in the response; the prompt or reply may have been blocked")
+        return text
+    
+    except Exception as e:
+        return f"⚠️ ERROR calling Gemini: {str(e)}\n\nUsing mock report instead."
+
+
+async def _call_openrouter_async(prompt: str, model: str = OPENROUTER_MODEL) -> str:
+    """
+    Call OpenRouter API without blocking the event loop
+    
+    Args:
+        prompt: The constructed prompt
+        model: Model to request
+        
+    Returns:
+        LLM-generated scouting report
+    """
+    if httpx is None:
+        return "⚠️ ERROR: httpx not installed. Run: pip install httpx"
+    
+    try:
+        api_key = _provider_api_key("openrouter")
+        if not api_key:
+            return "⚠️ ERROR: OPENROUTER_API_KEY not found in environment variables. Using mock report."
+        
+        body = {
+            "model": model,
+            "messages": _user_msg(prompt),
+            "max_tokens": LLM_MAX_OUTPUT_TOKENS
+        }
+        
+        # Reuse the batch's pooled client when one is active
+        client = _OPENROUTER_ASYNC_CLIENT.get()
+        if client is not None:
+            response = await _send_openrouter_async(client, api_key, body)
+        else:
+            async with _new_openrouter_async_client() as client:
+                response = await _send_openrouter_async(client, api_key, body)
         
-        return f"""---
+        data = decode_json(response.content)
+        
+        return data["choices"][0]["message"]["content"]
+    
+    except Exception as e:
+        return f"⚠️ ERROR calling OpenRouter: {str(e)}\n\nUsing mock report instead."
+
+
+# Provider dispatch: each entry takes the prompt and returns the report
+# (or, for streaming, an iterator of chunks; for async, an awaitable)
+_PROVIDERS = {
+    "openai": _call_openai,
+    "gemini": _call_gemini,
+    "openrouter": _call_openrouter
+}
+_STREAM_PROVIDERS = {
+    "openai": _call_openai_stream,
+    "gemini": _call_gemini_stream,
+    "openrouter": _call_openrouter_stream
+}
+_ASYNC_PROVIDERS = {
+    "openai": _call_openai_async,
+    "gemini": _call_gemini_async,
+    "openrouter": _call_openrouter_async
+}
+
+
+# Mock report layouts; filled from a dict of precomputed fields
+_MOCK_LOL_TEMPLATE = """---
 ## 🎯 SCOUTING REPORT: {team_name}
 
 ### 📊 Key Patterns
 
-**Win Rate:** {stats_dict.get("win_rate", 0):.1f}% ({stats_dict.get("matches_analyzed", 0)} matches analyzed)
+**Win Rate:** {win_rate:.1f}% ({matches_analyzed} matches analyzed)
 
 1. **Jungle Pathing is PREDICTABLE** - Heavy focus on certain lanes leaves others vulnerable
-2. **Early Objective Control is {'ELITE' if first_dragon_rate > 70 else 'INCONSISTENT'}** - {first_dragon_rate:.0f}% first dragon rate
-3. **Mid-Game Scaling Shows {'STRENGTH' if gold_at_15 > 0 else 'WEAKNESS'}** - {int(gold_at_15):+d} gold @ 15min
+2. **Early Objective Control is {objective_rating}** - {first_dragon_rate:.0f}% first dragon rate
+3. **Mid-Game Scaling Shows {scaling_rating}** - {gold_at_15:+d} gold @ 15min
 
 ### 🌲 Jungle Pressure Map
 
 **Lane Distribution:**
-- Top Lane: {jungle_data.get("top_lane_percent", 0):.1f}%
-- Mid Lane: {jungle_data.get("mid_lane_percent", 0):.1f}%
-- Bot Lane: {jungle_data.get("bot_lane_percent", 0):.1f}%
+- Top Lane: {top_lane_percent:.1f}%
+- Mid Lane: {mid_lane_percent:.1f}%
+- Bot Lane: {bot_lane_percent:.1f}%
 
-**⚠️ CRITICAL INSIGHT:** {weakest_lane} lane receives the LEAST jungle attention ({min(jungle_data.get("top_lane_percent", 0), jungle_data.get("mid_lane_percent", 0), jungle_data.get("bot_lane_percent", 0)):.1f}%). This is an exploitable weakness.
+**⚠️ CRITICAL INSIGHT:** {weakest_lane} lane receives the LEAST jungle attention ({weakest_percent:.1f}%). This is an exploitable weakness.
 
 ### 🐉 Objective Control Assessment
 
 **First Dragon Control:** {first_dragon_rate:.1f}%
-**Overall Dragon Control:** {objective_data.get("overall_dragon_rate", 0):.1f}%
-**Rift Herald Control:** {objective_data.get("herald_control_rate", 0):.1f}%
-**Baron Control:** {objective_data.get("baron_control_rate", 0):.1f}%
+**Overall Dragon Control:** {overall_dragon_rate:.1f}%
+**Rift Herald Control:** {herald_control_rate:.1f}%
+**Baron Control:** {baron_control_rate:.1f}%
 
-{'🚨 They STRUGGLE to secure early objectives - contest every dragon spawn!' if first_dragon_rate < 50 else '✅ Strong early objective control - must deny vision and contest aggressively.'}
+{objective_verdict}
 
 ### 💰 Economic Trends
 
-**Gold @ 10min:** {int(gold_data.get("gold_diff_at_10min", 0)):+d}
-**Gold @ 15min:** {int(gold_data.get("gold_diff_at_15min", 0)):+d}
-**Gold @ 20min:** {int(gold_data.get("gold_diff_at_20min", 0)):+d}
+**Gold @ 10min:** {gold_at_10:+d}
+**Gold @ 15min:** {gold_at_15:+d}
+**Gold @ 20min:** {gold_at_20:+d}
 
-{'🚨 They bleed gold in the mid-game - extend games and scale!' if gold_at_15 < 0 else '⚠️ They accelerate leads - must survive early game and prevent snowball.'}
+{gold_verdict}
 
 ### 🚨 THE WIN CONDITION
 
-**Their Fatal Flaw:** {weakest_lane} lane is ABANDONED by their jungler ({min(jungle_data.get("top_lane_percent", 0), jungle_data.get("mid_lane_percent", 0), jungle_data.get("bot_lane_percent", 0)):.1f}% presence). {'Early objective control is weak.' if first_dragon_rate < 50 else 'They over-commit to objectives - can be baited.'}
+**Their Fatal Flaw:** {weakest_lane} lane is ABANDONED by their jungler ({weakest_percent:.1f}% presence). {objective_flaw}
 
 **Our Counter-Strategy:**
 1. **Camp {weakest_lane} Lane** - Set up repeated ganks in the 8-15 minute window
 2. **Contest Every Drake** - Their {first_dragon_rate:.0f}% first dragon rate means we can steal early momentum
-3. {'**Survive to 15 Minutes** - They lose gold leads, we scale better' if gold_at_15 < 0 else '**Punish Their Early Aggression** - Force skirmishes before they establish vision control'}
+3. {gold_strategy}
 
 **Timing Window:** **Minutes 8-15** - Their jungler is predictable, and their macro is weakest here.
 
@@ -365,78 +1219,323 @@ def _generate_mock_report(stats_dict: Dict[str, Any], game_type: str) -> str:
 *Generated by Vanguard AI Scout | "Moneyball for Esports"*
 """
 
-    else:  # VALORANT
-        opening_data = stats_dict.get("opening_duel_stats", {})
-        site_data = stats_dict.get("site_bias_stats", {})
-        eco_data = stats_dict.get("economy_stats", {})
-        
-        fb_rate = opening_data.get("first_blood_rate", 0)
-        favorite_site = site_data.get("favorite_site", "A")
-        eco_conversion = eco_data.get("eco_conversion_rate", 0)
-        
-        return f"""---
+_MOCK_VALORANT_TEMPLATE = """---
 ## 🎯 SCOUTING REPORT: {team_name}
 
 ### 📊 Key Patterns
 
-**Match Win Rate:** {stats_dict.get("match_win_rate", 0):.1f}% | **Round Win Rate:** {stats_dict.get("round_win_rate", 0):.1f}%
-**Matches Analyzed:** {stats_dict.get("matches_analyzed", 0)} | **Total Rounds:** {stats_dict.get("total_rounds_played", 0)}
+**Match Win Rate:** {match_win_rate:.1f}% | **Round Win Rate:** {round_win_rate:.1f}%
+**Matches Analyzed:** {matches_analyzed} | **Total Rounds:** {total_rounds_played}
 
-1. **Opening Duels are {'ELITE' if fb_rate > 55 else 'INCONSISTENT'}** - {fb_rate:.1f}% first blood rate
-2. **HEAVILY PREDICTABLE Site Bias** - {favorite_site}-Site is attacked {site_data.get(f"site_{favorite_site}_percent", 0):.0f}% of the time
-3. **Eco Rounds are {'DANGEROUS' if eco_conversion > 20 else 'PREDICTABLE'}** - {eco_conversion:.1f}% win rate on saves
+1. **Opening Duels are {opening_rating}** - {fb_rate:.1f}% first blood rate
+2. **HEAVILY PREDICTABLE Site Bias** - {favorite_site}-Site is attacked {favorite_percent:.0f}% of the time
+3. **Eco Rounds are {eco_rating}** - {eco_conversion:.1f}% win rate on saves
 
 ### ⚔️ Opening Engagement Analysis
 
 **First Blood Rate:** {fb_rate:.1f}%
-**First Blood Conversion:** {opening_data.get("first_blood_conversion", 0):.1f}%
+**First Blood Conversion:** {first_blood_conversion:.1f}%
 
-**Rounds Won WITH First Blood:** {opening_data.get("rounds_won_with_fb", 0)}
-**Rounds Won WITHOUT First Blood:** {opening_data.get("rounds_won_without_fb", 0)}
+**Rounds Won WITH First Blood:** {rounds_won_with_fb}
+**Rounds Won WITHOUT First Blood:** {rounds_won_without_fb}
 
-{'🚨 They CRUMBLE when losing the opening duel - aggressive early peaks will tilt them!' if fb_rate < 50 else '⚠️ Strong early fraggers - must trade carefully and play post-plant.'}
+{opening_verdict}
 
 ### 🗺️ Site Attack Tendencies
 
-**Site A Attacks:** {site_data.get("site_A_percent", 0):.1f}% (Win Rate: {site_data.get("site_A_winrate", 0):.1f}%)
-**Site B Attacks:** {site_data.get("site_B_percent", 0):.1f}% (Win Rate: {site_data.get("site_B_winrate", 0):.1f}%)
-**Site C Attacks:** {site_data.get("site_C_percent", 0):.1f}% (Win Rate: {site_data.get("site_C_winrate", 0):.1f}%)
+**Site A Attacks:** {site_A_percent:.1f}% (Win Rate: {site_A_winrate:.1f}%)
+**Site B Attacks:** {site_B_percent:.1f}% (Win Rate: {site_B_winrate:.1f}%)
+**Site C Attacks:** {site_C_percent:.1f}% (Win Rate: {site_C_winrate:.1f}%)
 
-**⚠️ EXPLOITABLE BIAS:** They attack **{favorite_site}-Site {site_data.get(f"site_{favorite_site}_percent", 0):.0f}%** of the time. Stack {favorite_site} and force rotations.
+**⚠️ EXPLOITABLE BIAS:** They attack **{favorite_site}-Site {favorite_percent:.0f}%** of the time. Stack {favorite_site} and force rotations.
 
 ### 💳 Economic Discipline
 
 **Eco Round Conversion:** {eco_conversion:.1f}%
-**Force Buy Win Rate:** {eco_data.get("force_buy_winrate", 0):.1f}%
-**Full Buy Win Rate:** {eco_data.get("full_buy_winrate", 0):.1f}%
+**Force Buy Win Rate:** {force_buy_winrate:.1f}%
+**Full Buy Win Rate:** {full_buy_winrate:.1f}%
 
-{'🚨 They throw away eco rounds - sheriffs and spectres shut them down!' if eco_conversion < 15 else '⚠️ Dangerous on eco - must respect their aim and positioning.'}
+{eco_verdict}
 
 ### 🚨 THE WIN CONDITION
 
-**Their Fatal Flaw:** OVER-COMMITMENT to **{favorite_site}-Site** ({site_data.get(f"site_{favorite_site}_percent", 0):.0f}% of attacks). {'They cannot win without first blood.' if fb_rate < 50 else 'Predictable eco-round strats.'}
+**Their Fatal Flaw:** OVER-COMMITMENT to **{favorite_site}-Site** ({favorite_percent:.0f}% of attacks). {opening_flaw}
 
 **Our Counter-Strategy:**
 1. **Stack {favorite_site}-Site Early** - Put 3 players on {favorite_site} by default, they'll walk into the trap
-2. **Challenge Opening Duels Aggressively** - {('Take first blood and they fall apart' if fb_rate < 50 else 'Trade 1-for-1 and deny their entry fragger')}
-3. **{'Punish Eco Rounds Relentlessly' if eco_conversion < 15 else 'Respect Their Aim on Ecos'}** - {('Sheriff headshots are free - push aggressively' if eco_conversion < 15 else 'Play default and avoid risky peeks')}
+2. **Challenge Opening Duels Aggressively** - {opening_strategy}
+3. **{eco_strategy}** - {eco_strategy_detail}
 
 **Map Control Focus:** 
 - **Primary:** {favorite_site}-Site default setup (they WILL come here)
 - **Secondary:** Mid control to fast-rotate when they finally hit other sites
 
 **Round Type Exploit:**
-- **Eco Rounds:** {'Push aggressively, they have no answer' if eco_conversion < 15 else 'Play disciplined, they CAN upset'}
-- **Full Buy Rounds:** {('Deny their entry fragger and they crumble' if fb_rate < 50 else 'Trade carefully and play post-plant')}
+- **Eco Rounds:** {eco_exploit}
+- **Full Buy Rounds:** {full_buy_exploit}
 
 ---
 *Generated by Vanguard AI Scout | "Moneyball for Esports"*
 """
 
-    return "Error generating report."
+
+def _generate_mock_report(stats_dict: Dict[str, Any], game_type: str) -> str:
+    """
+    Generate a mock scouting report for testing without LLM API
+    
+    Args:
+        stats_dict: Statistical analysis dictionary
+        game_type: "lol" or "valorant"
+        
+    Returns:
+        Mock scouting report
+    """
+    
+    team_name = stats_dict.get("team_name", "Unknown Team")
+    
+    if game_type == "lol":
+        jungle_data = stats_dict.get("jungle_proximity", {})
+        objective_data = stats_dict.get("objective_control", {})
+        gold_data = stats_dict.get("gold_efficiency", {})
+        
+        lanes = [
+            ("Top", jungle_data.get("top_lane_percent", 0)),
+            ("Mid", jungle_data.get("mid_lane_percent", 0)),
+            ("Bot", jungle_data.get("bot_lane_percent", 0))
+        ]
+        weakest_lane, weakest_percent = min(lanes, key=itemgetter(1))
+        
+        first_dragon_rate = objective_data.get("first_dragon_rate", 0)
+        gold_at_15 = gold_data.get("gold_diff_at_15min", 0)
+        weak_early_objectives = first_dragon_rate < 50
+        bleeds_gold = gold_at_15 < 0
+        
+        return _MOCK_LOL_TEMPLATE.format_map({
+            "team_name": team_name,
+            "win_rate": stats_dict.get("win_rate", 0),
+            "matches_analyzed": stats_dict.get("matches_analyzed", 0),
+            "objective_rating": 'ELITE' if first_dragon_rate > 70 else 'INCONSISTENT',
+            "first_dragon_rate": first_dragon_rate,
+            "scaling_rating": 'STRENGTH' if gold_at_15 > 0 else 'WEAKNESS',
+            "top_lane_percent": lanes[0][1],
+            "mid_lane_percent": lanes[1][1],
+            "bot_lane_percent": lanes[2][1],
+            "weakest_lane": weakest_lane,
+            "weakest_percent": weakest_percent,
+            "overall_dragon_rate": objective_data.get("overall_dragon_rate", 0),
+            "herald_control_rate": objective_data.get("herald_control_rate", 0),
+            "baron_control_rate": objective_data.get("baron_control_rate", 0),
+            "objective_verdict": (
+                '🚨 They STRUGGLE to secure early objectives - contest every dragon spawn!' if weak_early_objectives
+                else '✅ Strong early objective control - must deny vision and contest aggressively.'
+            ),
+            "gold_at_10": int(gold_data.get("gold_diff_at_10min", 0)),
+            "gold_at_15": int(gold_at_15),
+            "gold_at_20": int(gold_data.get("gold_diff_at_20min", 0)),
+            "gold_verdict": (
+                '🚨 They bleed gold in the mid-game - extend games and scale!' if bleeds_gold
+                else '⚠️ They accelerate leads - must survive early game and prevent snowball.'
+            ),
+            "objective_flaw": (
+                'Early objective control is weak.' if weak_early_objectives
+                else 'They over-commit to objectives - can be baited.'
+            ),
+            "gold_strategy": (
+                '**Survive to 15 Minutes** - They lose gold leads, we scale better' if bleeds_gold
+                else '**Punish Their Early Aggression** - Force skirmishes before they establish vision control'
+            )
+        })
+
+    else:  # VALORANT
+        opening_data = stats_dict.get("opening_duel_stats", {})
+        site_data = stats_dict.get("site_bias_stats", {})
+        eco_data = stats_dict.get("economy_stats", {})
+        
+        fb_rate = opening_data.get("first_blood_rate", 0)
+        favorite_site = site_data.get("favorite_site", "A")
+        eco_conversion = eco_data.get("eco_conversion_rate", 0)
+        loses_opening_duels = fb_rate < 50
+        weak_on_eco = eco_conversion < 15
+        
+        return _MOCK_VALORANT_TEMPLATE.format_map({
+            "team_name": team_name,
+            "match_win_rate": stats_dict.get("match_win_rate", 0),
+            "round_win_rate": stats_dict.get("round_win_rate", 0),
+            "matches_analyzed": stats_dict.get("matches_analyzed", 0),
+            "total_rounds_played": stats_dict.get("total_rounds_played", 0),
+            "opening_rating": 'ELITE' if fb_rate > 55 else 'INCONSISTENT',
+            "fb_rate": fb_rate,
+            "favorite_site": favorite_site,
+            "favorite_percent": site_data.get(f"site_{favorite_site}_percent", 0),
+            "eco_rating": 'DANGEROUS' if eco_conversion > 20 else 'PREDICTABLE',
+            "eco_conversion": eco_conversion,
+            "first_blood_conversion": opening_data.get("first_blood_conversion", 0),
+            "rounds_won_with_fb": opening_data.get("rounds_won_with_fb", 0),
+            "rounds_won_without_fb": opening_data.get("rounds_won_without_fb", 0),
+            "opening_verdict": (
+                '🚨 They CRUMBLE when losing the opening duel - aggressive early peaks will tilt them!' if loses_opening_duels
+                else '⚠️ Strong early fraggers - must trade carefully and play post-plant.'
+            ),
+            "site_A_percent": site_data.get("site_A_percent", 0),
+            "site_A_winrate": site_data.get("site_A_winrate", 0),
+            "site_B_percent": site_data.get("site_B_percent", 0),
+            "site_B_winrate": site_data.get("site_B_winrate", 0),
+            "site_C_percent": site_data.get("site_C_percent", 0),
+            "site_C_winrate": site_data.get("site_C_winrate", 0),
+            "force_buy_winrate": eco_data.get("force_buy_winrate", 0),
+            "full_buy_winrate": eco_data.get("full_buy_winrate", 0),
+            "eco_verdict": (
+                '🚨 They throw away eco rounds - sheriffs and spectres shut them down!' if weak_on_eco
+                else '⚠️ Dangerous on eco - must respect their aim and positioning.'
+            ),
+            "opening_flaw": 'They cannot win without first blood.' if loses_opening_duels else 'Predictable eco-round strats.',
+            "opening_strategy": (
+                'Take first blood and they fall apart' if loses_opening_duels
+                else 'Trade 1-for-1 and deny their entry fragger'
+            ),
+            "eco_strategy": 'Punish Eco Rounds Relentlessly' if weak_on_eco else 'Respect Their Aim on Ecos',
+            "eco_strategy_detail": (
+                'Sheriff headshots are free - push aggressively' if weak_on_eco
+                else 'Play default and avoid risky peeks'
+            ),
+            "eco_exploit": 'Push aggressively, they have no answer' if weak_on_eco else 'Play disciplined, they CAN upset',
+            "full_buy_exploit": (
+                'Deny their entry fragger and they crumble' if loses_opening_duels
+                else 'Trade carefully and play post-plant'
+            )
+        })
 
 
 # Convenience function for direct use
 def scout_team(stats: Dict[str, Any], game: str) -> str:
     """Quick function to generate a scouting report"""
     return generate_scouting_report(stats, game, llm_provider="mock")
+
+
+def scout_teams_batch(stats_list: List[Dict[str, Any]], game: str, llm_provider: str = "openai",
+                      max_concurrency: int = 4) -> List[str]:
+    """
+    Generate scouting reports for several teams concurrently
+    
+    Args:
+        stats_list: Statistical analyses, one per team
+        game: "lol" or "valorant"
+        llm_provider: "openai", "gemini", "openrouter", or "mock" for testing
+        max_concurrency: Maximum number of in-flight LLM requests
+        
+    Returns:
+        Scouting reports in the same order as stats_list
+    """
+    return asyncio.run(_scout_teams_async(stats_list, game, llm_provider, max_concurrency))
+
+
+async def _scout_teams_async(stats_list: List[Dict[str, Any]], game: str, llm_provider: str,
+                             max_concurrency: int) -> List[str]:
+    """Run one async report per team, bounded by a semaphore"""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def scout(stats: Dict[str, Any]) -> str:
+        async with semaphore:
+            return await generate_scouting_report_async(stats, game, llm_provider)
+    
+    async def gather_reports() -> List[Any]:
+        # One failing team must not poison the rest of the batch
+        return await asyncio.gather(*(scout(stats) for stats in stats_list), return_exceptions=True)
+    
+    if llm_provider == "openai":
+        # Every OpenAI call in the batch reuses one client (and connection pool) per key
+        clients = {}
+        token = _OPENAI_ASYNC_CLIENTS.set(clients)
+        try:
+            results = await gather_reports()
+        finally:
+            _OPENAI_ASYNC_CLIENTS.reset(token)
+            for client in clients.values():
+                await client.close()
+    elif llm_provider != "openrouter":
+        results = await gather_reports()
+    else:
+        # Every OpenRouter call in the batch shares one pooled (HTTP/2) client
+        async with _new_openrouter_async_client() as client:
+            token = _OPENROUTER_ASYNC_CLIENT.set(client)
+            try:
+                results = await gather_reports()
+            finally:
+                _OPENROUTER_ASYNC_CLIENT.reset(token)
+    
+    return [
+        f"⚠️ ERROR generating report: {str(result)}" if isinstance(result, Exception) else result
+        for result in results
+    ]
+
+
+def generate_scouting_reports_batched(stats_list: List[Dict[str, Any]], game_type: str,
+                                      llm_provider: str = "openai",
+                                      max_teams_per_request: int = BATCH_MAX_TEAMS,
+                                      model: Optional[str] = None) -> List[str]:
+    """
+    Generate reports for several teams, packing up to max_teams_per_request
+    teams into each LLM request so they share one prefill of the static prompt
+    
+    Args:
+        stats_list: Statistical analyses, one per team
+        game_type: "lol" or "valorant"
+        llm_provider: "openai", "gemini", "openrouter", or "mock" for testing
+        max_teams_per_request: Upper bound on teams per request (input token
+            budget permitting)
+        model: Model override; by default picked per team (see _pick_model)
+        
+    Returns:
+        Scouting reports in the same order as stats_list
+    """
+    if llm_provider != "mock" and llm_provider not in _PROVIDERS:
+        raise ValueError(f"Unknown LLM provider: {llm_provider}")
+    
+    if llm_provider == "mock" or not _provider_api_key(llm_provider):
+        return [_generate_mock_report(stats, game_type) for stats in stats_list]
+    
+    reports: List[Optional[str]] = [None] * len(stats_list)
+    pending: Dict[str, List[Any]] = {}  # model -> [(index, cache_key, stats_json)] without a cached report
+    for index, stats in enumerate(stats_list):
+        team_model = model or _pick_model(stats, game_type, llm_provider)
+        cache_key = _report_cache_key(stats, game_type, llm_provider, model=team_model)
+        reports[index] = _load_cached_report(cache_key)
+        if reports[index] is None:
+            pending.setdefault(team_model, []).append((index, cache_key, _compact_stats_json(stats)))
+    
+    # Greedily fill each request up to the team and input-token limits
+    prefix_tokens = _estimate_tokens(_PROMPT_PREFIXES.get(game_type, _VALORANT_PROMPT_PREFIX))
+    groups = []
+    for team_model, teams in pending.items():
+        group, group_tokens = [], prefix_tokens
+        for team in teams:
+            team_tokens = _estimate_tokens(team[2])
+            if group and (len(group) >= max_teams_per_request or group_tokens + team_tokens > BATCH_MAX_INPUT_TOKENS):
+                groups.append((team_model, group))
+                group, group_tokens = [], prefix_tokens
+            group.append(team)
+            group_tokens += team_tokens
+        if group:
+            groups.append((team_model, group))
+    
+    for team_model, group in groups:
+        if len(group) == 1:
+            index = group[0][0]
+            reports[index] = generate_scouting_report(stats_list[index], game_type, llm_provider, model=team_model)
+            continue
+        
+        prompt = _build_batch_prompt([stats_json for _, _, stats_json in group], game_type)
+        response = _PROVIDERS[llm_provider](prompt, max_tokens=LLM_MAX_OUTPUT_TOKENS * len(group), model=team_model)
+        parts = [part.strip() for part in response.split(REPORT_DELIMITER) if part.strip()]
+        
+        if response.startswith("⚠️ ERROR") or len(parts) != len(group):
+            # Unusable batch response: generate these teams one by one instead
+            for index, _, _ in group:
+                reports[index] = generate_scouting_report(stats_list[index], game_type, llm_provider, model=team_model)
+            continue
+        
+        for (index, cache_key, _), report in zip(group, parts):
+            _store_report(cache_key, report)
+            reports[index] = report
+    
+    return reports
@@ -2,10 +2,40 @@
 Analysis Engines for League of Legends and VALORANT
 Provides "Moneyball-style" statistical insights
 """
-import pandas as pd
+import copy
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
 import numpy as np
-from typing import Dict, List, Any, Tuple
-from collections import Counter
+from typing import Dict, List, Any, Tuple, Optional
+from jsonio import canonical_json
+from columns import (
+    LANE_CODES, LANE_NAMES, SITE_NAMES, NO_SITE, TEAM,
+    LolMatchColumns, ValorantMatchColumns, build_lol_columns, build_valorant_columns
+)
+
+# Team loadout values splitting eco (< 2000), force (2000-3500) and full-buy rounds
+BUY_THRESHOLDS = (2000, 3500)
+
+# Complete analyses kept for repeat calls on the same matches
+ANALYSIS_CACHE_SIZE = 32  # Entries across both games
+
+# In-process LRU of complete analyses: (game, fingerprint) -> analysis
+_ANALYSIS_CACHE: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+
+# Guards _ANALYSIS_CACHE; Streamlit serves each session from its own thread
+_ANALYSIS_CACHE_LOCK = threading.Lock()
+
+
+def _memoized(method):
+    """Compute an analyzer metric once and reuse it on later calls"""
+    @functools.wraps(method)
+    def wrapper(self):
+        if method.__name__ not in self._results:
+            self._results[method.__name__] = method(self)
+        return self._results[method.__name__]
+    return wrapper
 
 
 class LolAnalyzer:
@@ -14,16 +44,20 @@ class LolAnalyzer:
     Calculates jungle proximity, objective control, and gold efficiency
     """
     
-    def __init__(self, matches: List[Dict[str, Any]]):
+    def __init__(self, matches: List[Dict[str, Any]], columns: Optional[LolMatchColumns] = None):
         """
         Initialize analyzer with match data
         
         Args:
             matches: List of LoL match dictionaries
+            columns: Columnar view of the same matches (built from matches if omitted)
         """
         self.matches = matches
-        self.team_name = matches[0]["team"] if matches else "Unknown"
+        self.columns = columns if columns is not None else build_lol_columns(matches)
+        self.team_name = self.columns.team_name
+        self._results: Dict[str, Any] = {}
     
+    @_memoized
     def calculate_jungle_proximity(self) -> Dict[str, Any]:
         """
         Calculate where the jungler spends the most time (Top/Mid/Bot)
@@ -31,12 +65,10 @@ class LolAnalyzer:
         Returns:
             Dictionary with lane percentages and heatmap data
         """
-        all_positions = []
-        
-        for match in self.matches:
-            all_positions.extend(match.get("jungle_positions", []))
+        cols = self.columns
+        xs, ys, lanes = cols.jungle_x, cols.jungle_y, cols.jungle_lane
         
-        if not all_positions:
+        if not lanes.size:
             return {
                 "top_lane_percent": 0,
                 "mid_lane_percent": 0,
@@ -45,19 +77,19 @@ class LolAnalyzer:
             }
         
         # Count lane presence
-        lane_counter = Counter(pos["lane"] for pos in all_positions)
-        total = len(all_positions)
+        lane_counts = np.bincount(lanes, minlength=len(LANE_CODES))
+        total = int(lanes.size)
+        top_lane = int(np.argmax(lane_counts))
         
         # Calculate percentages
-        top_percent = (lane_counter.get("Top", 0) / total) * 100
-        mid_percent = (lane_counter.get("Mid", 0) / total) * 100
-        bot_percent = (lane_counter.get("Bot", 0) / total) * 100
+        lane_percents = lane_counts / total * 100
+        top_percent, mid_percent, bot_percent = lane_percents.tolist()
         
-        # Prepare heatmap data
+        # Prepare heatmap data (arrays go straight to the plotter)
         heatmap_data = {
-            "x": [pos["x"] for pos in all_positions],
-            "y": [pos["y"] for pos in all_positions],
-            "lane": [pos["lane"] for pos in all_positions]
+            "x": xs,
+            "y": ys,
+            "lane": LANE_NAMES[lanes]
         }
         
         return {
@@ -66,9 +98,10 @@ class LolAnalyzer:
             "bot_lane_percent": round(bot_percent, 1),
             "total_samples": total,
             "heatmap_data": heatmap_data,
-            "insight": f"Jungler focuses {max(top_percent, mid_percent, bot_percent):.1f}% on {max(lane_counter, key=lane_counter.get)} lane"
+            "insight": f"Jungler focuses {lane_percents[top_lane]:.1f}% on {LANE_NAMES[top_lane]} lane"
         }
     
+    @_memoized
     def calculate_objective_control(self) -> Dict[str, Any]:
         """
         Calculate % of First Dragons and Rift Heralds taken
@@ -76,51 +109,26 @@ class LolAnalyzer:
         Returns:
             Dictionary with objective control statistics
         """
-        first_dragons = 0
-        first_dragons_taken = 0
-        
-        total_dragons = 0
-        team_dragons = 0
-        
-        total_heralds = 0
-        team_heralds = 0
-        
-        for match in self.matches:
-            # First Dragon analysis
-            dragons = match.get("dragons", [])
-            if dragons:
-                first_dragons += 1
-                if dragons[0]["team"] == self.team_name:
-                    first_dragons_taken += 1
-            
-            # All dragons
-            for dragon in dragons:
-                total_dragons += 1
-                if dragon["team"] == self.team_name:
-                    team_dragons += 1
-            
-            # Heralds
-            heralds = match.get("heralds", [])
-            for herald in heralds:
-                total_heralds += 1
-                if herald["team"] == self.team_name:
-                    team_heralds += 1
+        cols = self.columns
         
-        first_dragon_rate = (first_dragons_taken / first_dragons * 100) if first_dragons > 0 else 0
-        overall_dragon_rate = (team_dragons / total_dragons * 100) if total_dragons > 0 else 0
-        herald_rate = (team_heralds / total_heralds * 100) if total_heralds > 0 else 0
+        # First dragon of each match that had one: dragons are stored per match in order
+        first_dragon_idx = np.cumsum(cols.dragon_counts) - cols.dragon_counts
+        first_dragon_idx = first_dragon_idx[cols.dragon_counts > 0]
+        first_dragons = int(first_dragon_idx.size)
+        first_dragons_taken = int(np.count_nonzero(cols.dragon_team[first_dragon_idx] == TEAM))
+        
+        total_dragons = int(cols.dragon_team.size)
+        team_dragons = int(np.count_nonzero(cols.dragon_team == TEAM))
         
-        # Baron analysis
-        total_barons = 0
-        team_barons = 0
+        total_heralds = int(cols.herald_team.size)
+        team_heralds = int(np.count_nonzero(cols.herald_team == TEAM))
         
-        for match in self.matches:
-            barons = match.get("barons", [])
-            for baron in barons:
-                total_barons += 1
-                if baron["team"] == self.team_name:
-                    team_barons += 1
+        total_barons = int(cols.baron_team.size)
+        team_barons = int(np.count_nonzero(cols.baron_team == TEAM))
         
+        first_dragon_rate = (first_dragons_taken / first_dragons * 100) if first_dragons > 0 else 0
+        overall_dragon_rate = (team_dragons / total_dragons * 100) if total_dragons > 0 else 0
+        herald_rate = (team_heralds / total_heralds * 100) if total_heralds > 0 else 0
         baron_rate = (team_barons / total_barons * 100) if total_barons > 0 else 0
         
         return {
@@ -137,6 +145,7 @@ class LolAnalyzer:
             "insight": f"{'DOMINATES' if first_dragon_rate > 70 else 'STRUGGLES WITH'} early objective control ({first_dragon_rate:.0f}% first dragon rate)"
         }
     
+    @_memoized
     def calculate_gold_efficiency(self) -> Dict[str, Any]:
         """
         Calculate team gold difference at key timings (10, 15, 20 minutes)
@@ -144,28 +153,22 @@ class LolAnalyzer:
         Returns:
             Dictionary with gold efficiency metrics
         """
-        gold_at_10 = []
-        gold_at_15 = []
-        gold_at_20 = []
-        
-        for match in self.matches:
-            gold_updates = match.get("gold_updates", [])
-            
-            # Find closest gold update to each timing
-            for update in gold_updates:
-                timestamp = update["timestamp"]
-                gold_diff = update["gold_difference"]
-                
-                if 9 * 60 <= timestamp <= 11 * 60:
-                    gold_at_10.append(gold_diff)
-                elif 14 * 60 <= timestamp <= 16 * 60:
-                    gold_at_15.append(gold_diff)
-                elif 19 * 60 <= timestamp <= 21 * 60:
-                    gold_at_20.append(gold_diff)
-        
-        avg_gold_10 = np.mean(gold_at_10) if gold_at_10 else 0
-        avg_gold_15 = np.mean(gold_at_15) if gold_at_15 else 0
-        avg_gold_20 = np.mean(gold_at_20) if gold_at_20 else 0
+        cols = self.columns
+        order = np.argsort(cols.gold_timestamp, kind="stable")
+        timestamps = cols.gold_timestamp[order]
+        gold_diffs = cols.gold_difference[order]
+        
+        # Gold updates within a minute of each timing, found by binary search
+        windows = []
+        for minute in (10, 15, 20):
+            lo = np.searchsorted(timestamps, (minute - 1) * 60, side="left")
+            hi = np.searchsorted(timestamps, (minute + 1) * 60, side="right")
+            windows.append(gold_diffs[lo:hi])
+        gold_at_10, gold_at_15, gold_at_20 = windows
+        
+        avg_gold_10 = gold_at_10.mean() if gold_at_10.size else 0
+        avg_gold_15 = gold_at_15.mean() if gold_at_15.size else 0
+        avg_gold_20 = gold_at_20.mean() if gold_at_20.size else 0
         
         # Calculate gold growth rate
         growth_rate = 0
@@ -183,6 +186,7 @@ class LolAnalyzer:
             "insight": f"{'Strong' if avg_gold_15 > 0 else 'Weak'} mid-game scaling ({int(avg_gold_15):+d}g @ 15min)"
         }
     
+    @_memoized
     def get_complete_analysis(self) -> Dict[str, Any]:
         """
         Get comprehensive analysis combining all metrics
@@ -190,11 +194,12 @@ class LolAnalyzer:
         Returns:
             Complete statistical report
         """
-        wins = sum(1 for match in self.matches if match["won"])
-        total_matches = len(self.matches)
+        cols = self.columns
+        wins = int(np.count_nonzero(cols.won))
+        total_matches = cols.num_matches
         win_rate = (wins / total_matches * 100) if total_matches > 0 else 0
         
-        avg_game_duration = np.mean([match["duration"] for match in self.matches]) if self.matches else 0
+        avg_game_duration = cols.duration.mean() if total_matches else 0
         
         return {
             "team_name": self.team_name,
@@ -213,16 +218,43 @@ class ValorantAnalyzer:
     Calculates opening duel win%, site bias, and eco conversion rate
     """
     
-    def __init__(self, matches: List[Dict[str, Any]]):
+    def __init__(self, matches: List[Dict[str, Any]], columns: Optional[ValorantMatchColumns] = None):
         """
         Initialize analyzer with match data
         
         Args:
             matches: List of VALORANT match dictionaries
+            columns: Columnar view of the same matches (built from matches if omitted)
         """
         self.matches = matches
-        self.team_name = matches[0]["team"] if matches else "Unknown"
+        self.columns = columns if columns is not None else build_valorant_columns(matches)
+        self.team_name = self.columns.team_name
+        self._results: Dict[str, Any] = {}
     
+    @_memoized
+    def _round_table(self) -> np.ndarray:
+        """
+        Count every round by (first blood, won, spike site, buy type) in one fused pass
+        
+        The opening duel, site bias and economy metrics are all marginals of this
+        table, so the round columns are scanned once for all three.
+        
+        Returns:
+            Array of shape (2, 2, len(SITE_NAMES) + 1, 3): team got first blood,
+            team won the round, site code + 1 (0 = no plant), buy type
+            (0 = eco, 1 = force, 2 = full buy)
+        """
+        cols = self.columns
+        got_first_blood = (cols.round_fb == TEAM).astype(np.intp)
+        won_round = (cols.round_winner == TEAM).astype(np.intp)
+        site_slot = cols.round_site.astype(np.intp) + 1
+        buy_type = np.digitize(cols.round_loadout, BUY_THRESHOLDS)
+        
+        num_slots = len(SITE_NAMES) + 1
+        key = ((got_first_blood * 2 + won_round) * num_slots + site_slot) * 3 + buy_type
+        return np.bincount(key, minlength=4 * num_slots * 3).reshape(2, 2, num_slots, 3)
+    
+    @_memoized
     def calculate_opening_duel_winrate(self) -> Dict[str, Any]:
         """
         Calculate how often the team gets the first kill (5v4 advantage)
@@ -230,25 +262,13 @@ class ValorantAnalyzer:
         Returns:
             Dictionary with first blood statistics
         """
-        total_rounds = 0
-        team_first_bloods = 0
-        rounds_won_with_fb = 0
-        rounds_won_without_fb = 0
-        
-        for match in self.matches:
-            for round_data in match.get("rounds", []):
-                total_rounds += 1
-                
-                got_first_blood = round_data["first_blood_team"] == self.team_name
-                won_round = round_data["winner"] == self.team_name
-                
-                if got_first_blood:
-                    team_first_bloods += 1
-                    if won_round:
-                        rounds_won_with_fb += 1
-                else:
-                    if won_round:
-                        rounds_won_without_fb += 1
+        # [got first blood, won round] contingency table
+        outcomes = self._round_table().sum(axis=(2, 3))
+        
+        total_rounds = int(outcomes.sum())
+        team_first_bloods = int(outcomes[1].sum())
+        rounds_won_with_fb = int(outcomes[1, 1])
+        rounds_won_without_fb = int(outcomes[0, 1])
         
         fb_rate = (team_first_bloods / total_rounds * 100) if total_rounds > 0 else 0
         fb_conversion = (rounds_won_with_fb / team_first_bloods * 100) if team_first_bloods > 0 else 0
@@ -263,6 +283,7 @@ class ValorantAnalyzer:
             "insight": f"{'ELITE' if fb_rate > 55 else 'AVERAGE'} opening duelist ({fb_rate:.1f}% FB rate, {fb_conversion:.1f}% conversion)"
         }
     
+    @_memoized
     def calculate_site_bias(self) -> Dict[str, Any]:
         """
         Calculate % of times they attack A-Site vs. B-Site vs. C-Site
@@ -270,33 +291,30 @@ class ValorantAnalyzer:
         Returns:
             Dictionary with site attack preferences
         """
-        site_attacks = Counter()
-        site_wins = Counter()
-        
-        for match in self.matches:
-            for round_data in match.get("rounds", []):
-                spike_site = round_data.get("spike_site")
-                
-                if spike_site:
-                    site_attacks[spike_site] += 1
-                    
-                    if round_data["winner"] == self.team_name:
-                        site_wins[spike_site] += 1
-        
-        total_attacks = sum(site_attacks.values())
+        # [won round, site] counts for rounds with a plant
+        site_outcomes = self._round_table().sum(axis=(0, 3))[:, 1:]
+        attacks_per_site = site_outcomes.sum(axis=0)
+        wins_per_site = site_outcomes[1]
+        
+        # Attacked sites in order of first appearance, so ties favor the earliest
+        round_site = self.columns.round_site
+        seen_sites, first_seen = np.unique(round_site[round_site != NO_SITE], return_index=True)
+        seen_sites = seen_sites[np.argsort(first_seen)]
+        site_attacks = {SITE_NAMES[site_code]: int(attacks_per_site[site_code]) for site_code in seen_sites}
+        total_attacks = int(attacks_per_site.sum())
         
         site_percentages = {}
         site_win_rates = {}
         
-        for site in ["A", "B", "C"]:
-            attacks = site_attacks.get(site, 0)
-            wins = site_wins.get(site, 0)
+        for site_code, site in enumerate(SITE_NAMES):
+            attacks = int(attacks_per_site[site_code])
+            wins = int(wins_per_site[site_code])
             
             site_percentages[f"site_{site}_percent"] = round((attacks / total_attacks * 100), 1) if total_attacks > 0 else 0
             site_win_rates[f"site_{site}_winrate"] = round((wins / attacks * 100), 1) if attacks > 0 else 0
         
         # Find favorite site
-        favorite_site = max(site_attacks, key=site_attacks.get) if site_attacks else "Unknown"
+        favorite_site = SITE_NAMES[seen_sites[np.argmax(attacks_per_site[seen_sites])]] if seen_sites.size else "Unknown"
         
         return {
             **site_percentages,
@@ -308,6 +326,7 @@ class ValorantAnalyzer:
             "insight": f"HEAVILY favors {favorite_site}-Site ({site_percentages[f'site_{favorite_site}_percent']:.0f}% of attacks)"
         }
     
+    @_memoized
     def calculate_eco_conversion(self) -> Dict[str, Any]:
         """
         Calculate % of rounds won when spending < 2000 credits (Eco rounds)
@@ -315,34 +334,19 @@ class ValorantAnalyzer:
         Returns:
             Dictionary with economy statistics
         """
-        eco_rounds = 0
-        eco_wins = 0
-        
-        force_rounds = 0  # 2000-3500
-        force_wins = 0
-        
-        full_buy_rounds = 0  # 3500+
-        full_buy_wins = 0
-        
-        for match in self.matches:
-            for round_data in match.get("rounds", []):
-                team_loadout = round_data["team_loadout_value"]
-                won_round = round_data["winner"] == self.team_name
-                
-                if team_loadout < 2000:
-                    eco_rounds += 1
-                    if won_round:
-                        eco_wins += 1
-                
-                elif 2000 <= team_loadout < 3500:
-                    force_rounds += 1
-                    if won_round:
-                        force_wins += 1
-                
-                else:  # Full buy
-                    full_buy_rounds += 1
-                    if won_round:
-                        full_buy_wins += 1
+        # [won round, buy type] counts: eco, force (2000-3500), full buy (3500+)
+        buy_outcomes = self._round_table().sum(axis=(0, 2))
+        rounds_per_buy = buy_outcomes.sum(axis=0)
+        wins_per_buy = buy_outcomes[1]
+        
+        eco_rounds = int(rounds_per_buy[0])
+        eco_wins = int(wins_per_buy[0])
+        
+        force_rounds = int(rounds_per_buy[1])
+        force_wins = int(wins_per_buy[1])
+        
+        full_buy_rounds = int(rounds_per_buy[2])
+        full_buy_wins = int(wins_per_buy[2])
         
         eco_conversion_rate = (eco_wins / eco_rounds * 100) if eco_rounds > 0 else 0
         force_winrate = (force_wins / force_rounds * 100) if force_rounds > 0 else 0
@@ -359,6 +363,7 @@ class ValorantAnalyzer:
             "insight": f"{'DANGEROUS' if eco_conversion_rate > 20 else 'PREDICTABLE'} on eco rounds ({eco_conversion_rate:.1f}% win rate)"
         }
     
+    @_memoized
     def get_complete_analysis(self) -> Dict[str, Any]:
         """
         Get comprehensive analysis combining all metrics
@@ -366,15 +371,15 @@ class ValorantAnalyzer:
         Returns:
             Complete statistical report
         """
-        total_matches = len(self.matches)
-        wins = sum(1 for match in self.matches if match["won"])
+        cols = self.columns
+        total_matches = cols.num_matches
+        wins = int(np.count_nonzero(cols.won))
         win_rate = (wins / total_matches * 100) if total_matches > 0 else 0
         
-        total_rounds = sum(len(match["rounds"]) for match in self.matches)
-        team_rounds_won = sum(
-            sum(1 for r in match["rounds"] if r["winner"] == self.team_name)
-            for match in self.matches
-        )
+        # Round totals are marginals of the shared round table too
+        round_outcomes = self._round_table().sum(axis=(0, 2, 3))
+        total_rounds = int(round_outcomes.sum())
+        team_rounds_won = int(round_outcomes[1])
         round_win_rate = (team_rounds_won / total_rounds * 100) if total_rounds > 0 else 0
         
         return {
@@ -389,13 +394,42 @@ class ValorantAnalyzer:
         }
 
 
+def matches_fingerprint(matches: List[Dict[str, Any]]) -> str:
+    """
+    Build a content hash of a match list, events included
+    
+    Args:
+        matches: List of match dictionaries
+    
+    Returns:
+        Hex digest that changes whenever any match field or event changes
+    """
+    return hashlib.blake2b(canonical_json(matches), digest_size=16).hexdigest()
+
+
+def _cached_analysis(game: str, matches: List[Dict[str, Any]], analyzer_cls) -> Dict[str, Any]:
+    """Return the complete analysis for matches, reusing a cached result when seen before"""
+    cache_key = (game, matches_fingerprint(matches))
+    with _ANALYSIS_CACHE_LOCK:
+        analysis = _ANALYSIS_CACHE.get(cache_key)
+        if analysis is not None:
+            _ANALYSIS_CACHE.move_to_end(cache_key)
+            return copy.deepcopy(analysis)
+    
+    analysis = analyzer_cls(matches).get_complete_analysis()
+    with _ANALYSIS_CACHE_LOCK:
+        _ANALYSIS_CACHE[cache_key] = analysis
+        if len(_ANALYSIS_CACHE) > ANALYSIS_CACHE_SIZE:
+            _ANALYSIS_CACHE.popitem(last=False)
+    # Callers own their copy; edits must not reach the cached entry
+    return copy.deepcopy(analysis)
+
+
 def analyze_lol_team(matches: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Convenience function for LoL analysis"""
-    analyzer = LolAnalyzer(matches)
-    return analyzer.get_complete_analysis()
+    """Convenience function for LoL analysis (cached per match list)"""
+    return _cached_analysis("lol", matches, LolAnalyzer)
 
 
 def analyze_valorant_team(matches: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Convenience function for VALORANT analysis"""
-    analyzer = ValorantAnalyzer(matches)
-    return analyzer.get_complete_analysis()
+    """Convenience function for VALORANT analysis (cached per match list)"""
+    return _cached_analysis("valorant", matches, ValorantAnalyzer)
@@ -0,0 +1,161 @@
+"""
+Columnar (structure-of-arrays) views of match data
+Lets the analyzers scan contiguous NumPy arrays instead of nested match dicts
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Any
+import numpy as np
+
+# Integer codes for jungle lanes; LANE_NAMES maps them back
+LANE_CODES = {"Top": 0, "Mid": 1, "Bot": 2}
+LANE_NAMES = np.array(["Top", "Mid", "Bot"])
+
+# Integer codes for spike sites; NO_SITE marks rounds without a plant
+SITE_CODES = {"A": 0, "B": 1, "C": 2}
+SITE_NAMES = ("A", "B", "C")
+NO_SITE = -1
+
+# Side tags for objectives and per-round outcomes, resolved once at ingest
+TEAM = 0
+OPPONENT = 1
+
+
+@dataclass
+class LolMatchColumns:
+    """
+    League of Legends matches as flat arrays
+    
+    Per-match arrays have one entry per match; event arrays concatenate the
+    events of every match in order.
+    """
+    team_name: str
+    won: np.ndarray  # bool, per match
+    duration: np.ndarray  # int32 seconds, per match
+    jungle_x: np.ndarray  # float32, per jungle sample
+    jungle_y: np.ndarray  # float32, per jungle sample
+    jungle_lane: np.ndarray  # int8 lane code, per jungle sample
+    dragon_team: np.ndarray  # int8 TEAM/OPPONENT, per dragon
+    dragon_counts: np.ndarray  # int32 dragons per match, in timestamp order
+    herald_team: np.ndarray  # int8 TEAM/OPPONENT, per herald
+    baron_team: np.ndarray  # int8 TEAM/OPPONENT, per baron
+    gold_counts: np.ndarray  # int32 gold updates per match
+    gold_timestamp: np.ndarray  # int32 seconds, per gold update
+    gold_difference: np.ndarray  # int32, per gold update
+    
+    @property
+    def num_matches(self) -> int:
+        return len(self.won)
+
+
+@dataclass
+class ValorantMatchColumns:
+    """
+    VALORANT matches as flat arrays
+    
+    Round arrays concatenate the rounds of every match; round_match_idx maps
+    each round back to its match for per-match reductions.
+    """
+    team_name: str
+    won: np.ndarray  # bool, per match
+    round_match_idx: np.ndarray  # int32, per round
+    round_winner: np.ndarray  # int8 TEAM/OPPONENT, per round
+    round_fb: np.ndarray  # int8 TEAM/OPPONENT first blood, per round
+    round_site: np.ndarray  # int8 site code or NO_SITE, per round
+    round_loadout: np.ndarray  # int32 team loadout value, per round
+    
+    @property
+    def num_matches(self) -> int:
+        return len(self.won)
+
+
+def _per_match(matches: List[Dict[str, Any]], field: str, dtype) -> np.ndarray:
+    """Read one scalar field of every match straight into a typed array"""
+    return np.fromiter((match[field] for match in matches), dtype=dtype, count=len(matches))
+
+
+def build_lol_columns(matches: List[Dict[str, Any]]) -> LolMatchColumns:
+    """
+    Convert LoL match dictionaries into columns in a single pass
+    
+    Args:
+        matches: List of LoL match dictionaries
+    
+    Returns:
+        LolMatchColumns for the team of the first match
+    """
+    team_name = matches[0]["team"] if matches else "Unknown"
+    
+    jungle_x, jungle_y, jungle_lane = [], [], []
+    dragon_team, dragon_counts = [], []
+    herald_team, baron_team = [], []
+    gold_counts, gold_timestamp, gold_difference = [], [], []
+    
+    for match in matches:
+        for pos in match.get("jungle_positions", []):
+            jungle_x.append(pos["x"])
+            jungle_y.append(pos["y"])
+            jungle_lane.append(LANE_CODES[pos["lane"]])
+        
+        dragons = match.get("dragons", [])
+        dragon_counts.append(len(dragons))
+        dragon_team.extend(TEAM if dragon["team"] == team_name else OPPONENT for dragon in dragons)
+        herald_team.extend(TEAM if herald["team"] == team_name else OPPONENT for herald in match.get("heralds", []))
+        baron_team.extend(TEAM if baron["team"] == team_name else OPPONENT for baron in match.get("barons", []))
+        
+        gold_updates = match.get("gold_updates", [])
+        gold_counts.append(len(gold_updates))
+        for update in gold_updates:
+            gold_timestamp.append(update["timestamp"])
+            gold_difference.append(update["gold_difference"])
+    
+    return LolMatchColumns(
+        team_name=team_name,
+        won=_per_match(matches, "won", np.bool_),
+        duration=_per_match(matches, "duration", np.int32),
+        jungle_x=np.array(jungle_x, dtype=np.float32),
+        jungle_y=np.array(jungle_y, dtype=np.float32),
+        jungle_lane=np.array(jungle_lane, dtype=np.int8),
+        dragon_team=np.array(dragon_team, dtype=np.int8),
+        dragon_counts=np.array(dragon_counts, dtype=np.int32),
+        herald_team=np.array(herald_team, dtype=np.int8),
+        baron_team=np.array(baron_team, dtype=np.int8),
+        gold_counts=np.array(gold_counts, dtype=np.int32),
+        gold_timestamp=np.array(gold_timestamp, dtype=np.int32),
+        gold_difference=np.array(gold_difference, dtype=np.int32)
+    )
+
+
+def build_valorant_columns(matches: List[Dict[str, Any]]) -> ValorantMatchColumns:
+    """
+    Convert VALORANT match dictionaries into columns in a single pass
+    
+    Args:
+        matches: List of VALORANT match dictionaries
+    
+    Returns:
+        ValorantMatchColumns for the team of the first match
+    """
+    team_name = matches[0]["team"] if matches else "Unknown"
+    
+    round_counts = []
+    round_winner, round_fb, round_site, round_loadout = [], [], [], []
+    
+    for match in matches:
+        rounds = match.get("rounds", [])
+        round_counts.append(len(rounds))
+        
+        for round_data in rounds:
+            round_winner.append(TEAM if round_data["winner"] == team_name else OPPONENT)
+            round_fb.append(TEAM if round_data["first_blood_team"] == team_name else OPPONENT)
+            round_site.append(SITE_CODES.get(round_data.get("spike_site"), NO_SITE))
+            round_loadout.append(round_data["team_loadout_value"])
+    
+    return ValorantMatchColumns(
+        team_name=team_name,
+        won=_per_match(matches, "won", np.bool_),
+        round_match_idx=np.repeat(np.arange(len(matches), dtype=np.int32), round_counts),
+        round_winner=np.array(round_winner, dtype=np.int8),
+        round_fb=np.array(round_fb, dtype=np.int8),
+        round_site=np.array(round_site, dtype=np.int8),
+        round_loadout=np.array(round_loadout, dtype=np.int32)
+    )
@@ -0,0 +1,36 @@
+"""
+JSON encoding shared by the GRID loader, the analyzers and the LLM agent
+Uses orjson when it is installed and falls back to the stdlib json module
+"""
+from typing import Any, Union
+import json
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib encoder/parser
+    orjson = None
+
+
+def encode_json(payload: Any) -> bytes:
+    """Serialize a request body to compact JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def decode_json(data: Union[bytes, str]) -> Any:
+    """Parse a response body"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def canonical_json(value: Any) -> bytes:
+    """Serialize with sorted keys and no whitespace, for hashing (unknown types fall back to str)"""
+    if orjson is not None:
+        return orjson.dumps(
+            value,
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode()
@@ -2,16 +2,131 @@
 Data Loaders for GRID Esports API
 Handles fetching data from GRID Stats Feed API and Mock Generators
 """
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import functools
+import os
+import threading
+import time
+import zlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import mock_data
+from jsonio import encode_json, decode_json
+from columns import LolMatchColumns, ValorantMatchColumns, build_lol_columns, build_valorant_columns
 import datetime
-import random
+import numpy as np
 
 # GRID API Endpoints (Open Access)
 GRID_CENTRAL_DATA_URL = "https://api-op.grid.gg/central-data/graphql"  # Static data: teams, tournaments
 GRID_STATS_FEED_URL = "https://api-op.grid.gg/statistics-feed/graphql"  # Aggregated statistics
 
+# Connection pool for the GRID session (keep-alive reuses the TLS handshake)
+GRID_POOL_CONNECTIONS = 4  # Hosts kept in the pool
+GRID_POOL_MAXSIZE = 16  # Open connections per host
+GRID_MAX_RETRIES = 3  # Transport-level retries with backoff
+GRID_MAX_WORKERS = 8  # Concurrent statistics fetches in load_many
+
+# Mock matches are generated once per team and sliced per request
+MOCK_POOL_SIZE = 50  # Matches generated per (game, team) pool
+
+# Team statistics cache (the LAST_3_MONTHS window barely moves hour to hour)
+# Created on first use and safe to delete; anchored next to this module so a
+# server restarted from another directory still finds it
+GRID_CACHE_DIR = os.getenv("GRID_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".grid_cache"))
+GRID_CACHE_TTL = 3600  # Seconds before a cached entry is revalidated with its ETag
+GRID_MEMORY_CACHE_SIZE = 64  # Entries kept in-process in front of the disk cache
+
+# In-process LRU of cache entries: key -> {"stats", "etag", "fetched_at"}
+_STATS_MEMORY_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_STATS_MEMORY_LOCK = threading.Lock()  # load_many fetches from worker threads
+
+
+def _team_seed(game_type: str, team_name: str, size: int) -> int:
+    """Stable per-team seed for generated match details (same across restarts)"""
+    return zlib.crc32(f"{game_type}:{team_name}:{size}".encode())
+
+
+@functools.lru_cache(maxsize=32)
+def _mock_pool(game_type: str, team_name: str, size: int) -> Tuple[Dict[str, Any], ...]:
+    """Generate a team's mock matches once; the pool is shared, so only _mock_matches reads it"""
+    # Seeded per team, so a restarted server rebuilds the same stats and hits the report cache
+    seed = _team_seed(game_type, team_name, size)
+    if game_type == "lol":
+        return tuple(mock_data.get_lol_mock_data(team_name, size, seed=seed))
+    return tuple(mock_data.get_valorant_mock_data(team_name, size, seed=seed))
+
+
+def _mock_matches(game_type: str, team_name: str, num_matches: int) -> List[Dict[str, Any]]:
+    """Return copies of the first num_matches matches of the team's mock pool"""
+    # Deep copies, so a caller editing its matches can't corrupt later loads
+    return copy.deepcopy(list(_mock_pool(game_type, team_name, max(MOCK_POOL_SIZE, num_matches))[:num_matches]))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_stats_cache():
+    """
+    Open the on-disk statistics cache
+    
+    Returns:
+        diskcache.Cache instance, or None when diskcache is not installed
+    """
+    try:
+        import diskcache
+    except ImportError:
+        return None
+    
+    return diskcache.Cache(GRID_CACHE_DIR)
+
+
+def _load_cached_stats(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Return the cached entry for a team/game, or None on a miss"""
+    with _STATS_MEMORY_LOCK:
+        entry = _STATS_MEMORY_CACHE.get(cache_key)
+        if entry is not None:
+            _STATS_MEMORY_CACHE.move_to_end(cache_key)
+            return entry
+    
+    cache = _get_stats_cache()
+    if cache is None:
+        return None
+    
+    try:
+        entry = cache.get(cache_key)
+    except Exception:
+        return None
+    
+    if entry is not None:
+        _remember_stats(cache_key, entry)
+    return entry
+
+
+def _store_cached_stats(cache_key: str, stats: Dict, etag: Optional[str]) -> None:
+    """Save statistics with their ETag and fetch time; cache failures are never fatal"""
+    entry = {"stats": stats, "etag": etag, "fetched_at": time.time()}
+    _remember_stats(cache_key, entry)
+    
+    cache = _get_stats_cache()
+    if cache is None:
+        return
+    
+    try:
+        cache.set(cache_key, entry)
+    except Exception:
+        pass
+
+
+def _remember_stats(cache_key: str, entry: Dict[str, Any]) -> None:
+    """Insert into the in-process LRU, evicting the oldest entry when full"""
+    with _STATS_MEMORY_LOCK:
+        _STATS_MEMORY_CACHE[cache_key] = entry
+        _STATS_MEMORY_CACHE.move_to_end(cache_key)
+        if len(_STATS_MEMORY_CACHE) > GRID_MEMORY_CACHE_SIZE:
+            _STATS_MEMORY_CACHE.popitem(last=False)
+
 
 class GridDataLoader:
     """
@@ -33,27 +148,83 @@ class GridDataLoader:
         
         if not use_mock and not api_key:
             raise ValueError("API key required when not using mock data")
+        
+        # Shared session so repeated GraphQL calls reuse pooled connections
+        self._session = requests.Session()
+        self._session.headers.update({"x-api-key": api_key, "Content-Type": "application/json"})
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=GRID_POOL_CONNECTIONS,
+            pool_maxsize=GRID_POOL_MAXSIZE,
+            max_retries=Retry(total=GRID_MAX_RETRIES, backoff_factor=0.3)
+        ))
     
     def load_lol_matches(self, team_name: str = "Cloud9", num_matches: int = 10) -> List[Dict[str, Any]]:
         """Load League of Legends match data"""
         if self.use_mock:
-            return mock_data.get_lol_mock_data(team_name, num_matches)
+            return _mock_matches("lol", team_name, num_matches)
         else:
             return self._fetch_from_grid_api(team_name, num_matches, "lol")
     
     def load_valorant_matches(self, team_name: str = "Cloud9", num_matches: int = 10) -> List[Dict[str, Any]]:
         """Load VALORANT match data"""
         if self.use_mock:
-            return mock_data.get_valorant_mock_data(team_name, num_matches)
+            return _mock_matches("valorant", team_name, num_matches)
         else:
             return self._fetch_from_grid_api(team_name, num_matches, "valorant")
     
-    def _fetch_from_grid_api(self, team_name: str, num_matches: int, game_type: str) -> List[Dict]:
+    def load_lol_matches_with_columns(self, team_name: str = "Cloud9",
+                                      num_matches: int = 10) -> Tuple[List[Dict[str, Any]], LolMatchColumns]:
+        """Load League of Legends match data along with its columnar view for LolAnalyzer"""
+        matches = self.load_lol_matches(team_name, num_matches)
+        return matches, build_lol_columns(matches)
+    
+    def load_valorant_matches_with_columns(self, team_name: str = "Cloud9",
+                                           num_matches: int = 10) -> Tuple[List[Dict[str, Any]], ValorantMatchColumns]:
+        """Load VALORANT match data along with its columnar view for ValorantAnalyzer"""
+        matches = self.load_valorant_matches(team_name, num_matches)
+        return matches, build_valorant_columns(matches)
+    
+    def load_many(self, team_game_pairs: List[Tuple[str, str]],
+                  num_matches: int = 10) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+        """
+        Load match data for several teams, fetching GRID statistics concurrently
+        
+        Args:
+            team_game_pairs: (team name or "TeamID:<id>", "lol" | "valorant") pairs
+            num_matches: Number of matches to load per team
+            
+        Returns:
+            Dictionary mapping each (team, game) pair to its match list
+        """
+        prefetched = {}
+        if not self.use_mock:
+            # Network waits release the GIL, so N teams cost about one round trip
+            keys = list({(team.replace("TeamID:", ""), game)
+                         for team, game in team_game_pairs if team.startswith("TeamID:")})
+            with ThreadPoolExecutor(max_workers=GRID_MAX_WORKERS) as executor:
+                prefetched = dict(zip(keys, executor.map(lambda key: self._fetch_team_statistics(*key), keys)))
+        
+        results = {}
+        for team, game in team_game_pairs:
+            if self.use_mock:
+                results[(team, game)] = self.load_lol_matches(team, num_matches) if game == "lol" else self.load_valorant_matches(team, num_matches)
+            else:
+                # A failed prefetch is stored as None; it is not retried
+                key = (team.replace("TeamID:", ""), game)
+                results[(team, game)] = self._fetch_from_grid_api(team, num_matches, game,
+                                                                  prefetched_stats=prefetched.get(key),
+                                                                  prefetched=key in prefetched)
+        return results
+    
+    def _fetch_from_grid_api(self, team_name: str, num_matches: int, game_type: str,
+                             prefetched_stats: Optional[Dict] = None, prefetched: bool = False) -> List[Dict]:
         """
         Fetch data from GRID Stats Feed API
         
         For now, requires direct team ID input (format: "TeamID:83")
         Team name search is disabled due to Central Data API schema complexity
+        prefetched=True means load_many already requested the statistics; prefetched_stats
+        holds its result (None when that request failed) and no second request is made
         """
         if not self.api_key:
             raise ValueError("API Key missing.")
@@ -69,13 +240,13 @@ class GridDataLoader:
             print(f"❌ Team name search not available - please use Team ID")
             print(f"💡 Tip: Check 'Use Team ID instead of name' and enter team ID (e.g., 83)")
             print("⚠️  Falling back to mock data...")
-            return mock_data.get_lol_mock_data(team_name, num_matches) if game_type == "lol" else mock_data.get_valorant_mock_data(team_name, num_matches)
+            return _mock_matches(game_type, team_name, num_matches)
         
         # Fetch aggregated statistics from Stats Feed
-        stats_data = self._fetch_team_statistics(team_id, game_type)
+        stats_data = prefetched_stats if prefetched else self._fetch_team_statistics(team_id, game_type)
         if not stats_data:
             print("⚠️  No statistics available. Falling back to mock data...")
-            return mock_data.get_lol_mock_data(team_name, num_matches) if game_type == "lol" else mock_data.get_valorant_mock_data(team_name, num_matches)
+            return _mock_matches(game_type, team_name, num_matches)
         
         # Transform to matches - use a clean team name
         display_name = f"Team {team_id}" if team_name.startswith("TeamID:") else team_name
@@ -97,14 +268,13 @@ class GridDataLoader:
         """
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 GRID_CENTRAL_DATA_URL,
-                json={"query": query, "variables": {"titleId": title_ids[game_type]}},
-                headers={"x-api-key": self.api_key, "Content-Type": "application/json"},
+                data=encode_json({"query": query, "variables": {"titleId": title_ids[game_type]}}),
                 timeout=10
             )
             response.raise_for_status()
-            data = response.json()
+            data = decode_json(response.content)
             
             if "errors" in data:
                 print(f"❌ Central Data API Error: {data['errors']}")
@@ -124,7 +294,21 @@ class GridDataLoader:
         return None
     
     def _fetch_team_statistics(self, team_id: str, game_type: str) -> Optional[Dict]:
-        """Fetch aggregated statistics from Stats Feed API"""
+        """
+        Fetch aggregated statistics from Stats Feed API
+        
+        Responses are cached per team and game for GRID_CACHE_TTL seconds; after
+        that the stored ETag is sent back and a 304 reuses the cached statistics.
+        """
+        cache_key = f"{game_type}:{team_id}"
+        cached = _load_cached_stats(cache_key)
+        if cached is not None and time.time() - cached["fetched_at"] < GRID_CACHE_TTL:
+            print(f"📦 Using cached statistics (Team ID: {team_id})")
+            return cached["stats"]
+        
+        headers = {}
+        if cached is not None and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
         
         # Use exact GRID Stats Feed query format
         query = """
@@ -180,14 +364,19 @@ class GridDataLoader:
         
         try:
             print(f"📊 Fetching statistics from Stats Feed (Team ID: {team_id})...")
-            response = requests.post(
+            response = self._session.post(
                 GRID_STATS_FEED_URL,
-                json={"query": query, "variables": {"teamId": team_id}},
-                headers={"x-api-key": self.api_key, "Content-Type": "application/json"},
+                data=encode_json({"query": query, "variables": {"teamId": team_id}}),
+                headers=headers,
                 timeout=10
             )
+            if response.status_code == 304 and cached is not None:
+                # Unchanged since the last fetch: refresh the TTL, skip the body
+                print(f"📦 Statistics unchanged (Team ID: {team_id})")
+                _store_cached_stats(cache_key, cached["stats"], cached["etag"])
+                return cached["stats"]
             response.raise_for_status()
-            data = response.json()
+            data = decode_json(response.content)
             
             if "errors" in data:
                 print(f"❌ Stats Feed API Error: {data['errors']}")
@@ -198,6 +387,7 @@ class GridDataLoader:
                 wins_data = stats["game"]["wins"]
                 win_pct = next((w["percentage"] for w in wins_data if w["value"] == True), 50.0)
                 print(f"✅ Stats: {stats['series']['count']} series, {stats['game']['count']} games, {win_pct:.1f}% win rate")
+                _store_cached_stats(cache_key, stats, response.headers.get("ETag"))
                 return stats
                 
         except Exception as e:
@@ -223,26 +413,24 @@ class GridDataLoader:
         from mock_data import MockDataGenerator
         mock_gen = MockDataGenerator()
         
+        # Seeded per team, so unchanged statistics give the same matches (and the
+        # same report cache key) across reruns and restarts
+        seed = _team_seed(game_type, team_name, num_matches)
+        
         # Generate all matches at once with the correct function signature
         if game_type == "lol":
-            matches = mock_gen.generate_lol_match_data(team_name, num_matches)
+            matches = mock_gen.generate_lol_match_data(team_name, num_matches, seed=seed)
         else:
-            matches = mock_gen.generate_valorant_match_data(team_name, num_matches)
+            matches = mock_gen.generate_valorant_match_data(team_name, num_matches, seed=seed)
         
-        # Now apply real win rate distribution
+        # Now apply real win rate distribution, shuffling which matches were won
         num_wins_expected = int(len(matches) * (real_win_pct / 100.0))
-        num_wins_applied = 0
-        
-        for match in matches:
-            if num_wins_applied < num_wins_expected:
-                match["won"] = True
-                num_wins_applied += 1
-            else:
-                match["won"] = False
+        wins = np.zeros(len(matches), dtype=np.bool_)
+        wins[:num_wins_expected] = True
+        np.random.default_rng(seed).shuffle(wins)
         
-        # Shuffle to randomize win distribution
-        import random
-        random.shuffle(matches)
+        for match, won in zip(matches, wins.tolist()):
+            match["won"] = won
         
         print(f"✅ Generated {len(matches)} matches with real {real_win_pct:.1f}% win rate")
         return matches
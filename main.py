@@ -2,23 +2,36 @@
 Vanguard - God-Tier Esports Scouting Report Generator
 Cloud9 Hackathon Submission
 """
+import os
+import hashlib
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import streamlit as st
 import pandas as pd
 from loaders import GridDataLoader
-from analyzers import LolAnalyzer, ValorantAnalyzer
+from columns import LolMatchColumns, ValorantMatchColumns
+from analyzers import LolAnalyzer, ValorantAnalyzer, matches_fingerprint
 from agent import generate_scouting_report
 import utils
 
-# Page configuration
-st.set_page_config(
-    page_title="Vanguard - Esports Scout AI",
-    page_icon="🎯",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+# Sidebar LLM provider labels -> agent provider names
+LLM_PROVIDERS = {
+    "Mock (No API)": "mock",
+    "OpenAI GPT-4": "openai",
+    "Google Gemini": "gemini",
+    "OpenRouter (Gemma 3 27B - Free)": "openrouter"
+}
+
+# Show Python tracebacks in the error panel (set DEBUG_MODE=True in the environment)
+DEBUG_MODE = os.getenv("DEBUG_MODE", "False").lower() in ("1", "true", "yes")
+
+# Report workers shared by every session on this server. Each report holds a worker
+# for its whole LLM call; reports beyond this many at once queue until one finishes.
+REPORT_WORKERS = int(os.getenv("REPORT_WORKERS", "16"))
 
-# Custom CSS for dark theme
-st.markdown("""
+# Static page content, built once at import rather than on every rerun
+_CUSTOM_CSS = """
     <style>
     .main {
         background-color: #0f1419;
@@ -36,7 +49,370 @@ st.markdown("""
         color: #ffffff;
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+_LANDING_MARKDOWN = """
+    ## 👋 Welcome to Vanguard
+    
+    **Vanguard** is a God-Tier automated esports scouting system that provides "Moneyball-style" 
+    statistical analysis for competitive gaming teams.
+    
+    ### 🎮 Supported Games
+    - **League of Legends**: Jungle proximity heatmaps, objective control rates, gold efficiency
+    - **VALORANT**: Opening duel statistics, site bias analysis, economy conversion rates
+    
+    ### 🤖 AI-Powered Insights
+    Our LLM-based "Agentic Scout" analyzes your statistical data and generates:
+    - **Pattern Recognition**: Identifies exploitable weaknesses
+    - **Win Condition Strategy**: Specific, actionable counter-strategies
+    - **Timing Windows**: Exact timeframes to execute your game plan
+    - **Target Priorities**: Who and what to focus on
+    
+    ### 🚀 Getting Started
+    1. Select your game (LoL or VALORANT) in the sidebar
+    2. Enter the team name you want to analyze
+    3. Choose how many recent matches to include
+    4. Click **"Generate Scouting Report"**
+    
+    ### 📊 What You'll Get
+    - Interactive heatmaps and charts
+    - Comprehensive statistical breakdowns
+    - AI-generated coaching insights
+    - Downloadable markdown reports
+    
+    ---
+    
+    **Ready to dominate?** Configure your settings in the sidebar and click the generate button! 🎯
+    """
+
+_FOOTER_HTML = """
+<div style='text-align: center; color: #8b8d98;'>
+    <p><strong>Vanguard</strong> - Moneyball for Esports</p>
+    <p>Built for Sky Is The Limit Hackathon 2026 | Powered by GRID Esports API & AI</p>
+</div>
+"""
+
+# Page configuration
+st.set_page_config(
+    page_title="Vanguard - Esports Scout AI",
+    page_icon="🎯",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Custom CSS for dark theme (emitted every run; Streamlit drops elements a rerun skips)
+st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
+
+
+# Cached pipeline steps: reruns with unchanged inputs skip loading, analysis and LLM calls.
+# Underscore-prefixed arguments are not hashed by Streamlit, so API keys only enter
+# the cache key as a hash.
+def _hash_key(api_key: Optional[str]) -> str:
+    """Hash an API key for use in a cache key"""
+    return hashlib.sha256(api_key.encode()).hexdigest() if api_key else ""
+
+
+@st.cache_data(show_spinner=False)
+def _default_key(name: str) -> str:
+    """Read a default API key from Streamlit secrets, else the environment, once per process"""
+    try:
+        return st.secrets.get(name, "")
+    except Exception:
+        return os.getenv(name, "")
+
+
+@st.cache_resource(show_spinner=False)
+def _get_loader(use_mock: bool, api_key_hash: str, _api_key: Optional[str] = None) -> GridDataLoader:
+    """Share one loader (and its pooled GRID session) per data source across reruns"""
+    return GridDataLoader(api_key=_api_key, use_mock=use_mock)
+
+
+@st.cache_data(show_spinner=False)
+def _load_matches(game: str, team: str, num_matches: int, use_live: bool,
+                  api_key_hash: str, _api_key: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Any]:
+    """Load matches for a team from GRID or the mock generator, with their columnar view"""
+    if use_live and _api_key:
+        loader = _get_loader(False, api_key_hash, _api_key=_api_key)
+    else:
+        loader = _get_loader(True, "")
+    
+    if game == "lol":
+        return loader.load_lol_matches_with_columns(team, num_matches)
+    return loader.load_valorant_matches_with_columns(team, num_matches)
+
+
+@st.cache_data(show_spinner=False)
+def _analyze_lol(fingerprint: str, _matches: List[Dict[str, Any]],
+                 _columns: LolMatchColumns) -> Dict[str, Any]:
+    """Run the LoL analysis over prebuilt columns, keyed on the match-list content hash"""
+    return LolAnalyzer(_matches, columns=_columns).get_complete_analysis()
+
+
+@st.cache_data(show_spinner=False)
+def _analyze_valorant(fingerprint: str, _matches: List[Dict[str, Any]],
+                      _columns: ValorantMatchColumns) -> Dict[str, Any]:
+    """Run the VALORANT analysis over prebuilt columns, keyed on the match-list content hash"""
+    return ValorantAnalyzer(_matches, columns=_columns).get_complete_analysis()
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _lol_figures(fingerprint: str, team: str, _matches: List[Dict[str, Any]],
+                 _columns: LolMatchColumns, _stats: Dict[str, Any]) -> Tuple[Any, Any, Any]:
+    """Build the heatmap, objective timeline and gold chart once per match list"""
+    return (
+        utils.create_jungle_heatmap(_stats["jungle_proximity"]["heatmap_data"]),
+        utils.create_objective_timeline(_matches, team),
+        utils.create_gold_diff_chart(_matches, columns=_columns)
+    )
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _valorant_figures(fingerprint: str, team: str, _matches: List[Dict[str, Any]],
+                      _columns: ValorantMatchColumns, _stats: Dict[str, Any]) -> Tuple[Any, Any]:
+    """Build the site bias and economy charts once per match list"""
+    return (
+        utils.create_site_bias_chart(_stats["site_bias_stats"]),
+        utils.create_economy_chart(_stats["economy_stats"])
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _report_pool() -> ThreadPoolExecutor:
+    """Background workers, shared across sessions, so the LLM call overlaps with chart rendering"""
+    return ThreadPoolExecutor(max_workers=REPORT_WORKERS, thread_name_prefix="report")
+
+
+def _stream_report(report_chunks: "queue.Queue[Optional[str]]", stats: Dict[str, Any], game: str,
+                   provider: str, api_keys: Optional[Dict[str, str]] = None) -> str:
+    """
+    Generate the scouting report in a worker, handing chunks to the page as they arrive
+    
+    Repeat runs on the same stats are served whole from the agent's report cache.
+    
+    Returns:
+        Complete report text
+    """
+    parts = []
+    try:
+        for chunk in generate_scouting_report(stats, game, provider, stream=True, api_keys=api_keys):
+            parts.append(chunk)
+            report_chunks.put(chunk)
+    finally:
+        report_chunks.put(None)
+    return "".join(parts)
+
+
+def _drain(report_chunks: "queue.Queue[Optional[str]]") -> Iterator[str]:
+    """Yield streamed report chunks until the worker signals the end"""
+    while (chunk := report_chunks.get()) is not None:
+        yield chunk
+
+
+@st.fragment
+def _report_section(report_future: Future, report_chunks: "queue.Queue[Optional[str]]",
+                    team_name: str, game_label: str) -> None:
+    """Render the AI report and its download button; clicks here rerun only this section"""
+    st.markdown("---")
+    st.header("🤖 AI-Generated Scouting Report")
+    
+    try:
+        if report_future.done():
+            report = report_future.result()
+            st.markdown(report)
+        else:
+            # Show tokens as they arrive instead of waiting for the full completion
+            st.write_stream(_drain(report_chunks))
+            report = report_future.result()
+    except Exception as e:
+        # Fragment reruns skip the page's error handler, so report the failure here
+        st.error("❌ An error occurred while generating the report")
+        st.error(f"**Error details:** {str(e)}")
+        if DEBUG_MODE:
+            with st.expander("🔧 Technical Details (for debugging)"):
+                import traceback
+                st.code(traceback.format_exc())
+        return
+    
+    # Download button for report
+    st.download_button(
+        label="📥 Download Scouting Report",
+        data=report,
+        file_name=f"scouting_report_{team_name}_{game_label}.md",
+        mime="text/markdown"
+    )
+
+
+# Page layout per game: header cards, then sections of chart, metric columns and insight.
+# Cards are (title, value, subtitle, color); metrics are (label, value, delta).
+def _lol_cards(stats: Dict[str, Any]) -> List[Tuple[str, str, str, str]]:
+    """Header stat cards for a LoL analysis"""
+    jungle_data = stats["jungle_proximity"]
+    obj_data = stats["objective_control"]
+    gold_15 = stats["gold_efficiency"]["gold_diff_at_15min"]
+    max_lane = max(
+        jungle_data["top_lane_percent"],
+        jungle_data["mid_lane_percent"],
+        jungle_data["bot_lane_percent"]
+    )
+    return [
+        ("Win Rate", f"{stats['win_rate']:.1f}%", f"{stats['matches_analyzed']} matches",
+         utils.get_color_by_performance(stats["win_rate"], 60, 40)),
+        ("Jungle Focus", f"{max_lane:.0f}%", "Most prioritized lane", "#ffa94d"),
+        ("First Dragon", f"{obj_data['first_dragon_rate']:.0f}%", "Control rate",
+         utils.get_color_by_performance(obj_data["first_dragon_rate"], 60, 40)),
+        ("Gold @ 15min", f"{int(gold_15):+d}", "Average difference",
+         utils.get_color_by_performance(gold_15, 500, -500))
+    ]
+
+
+def _lol_sections(stats: Dict[str, Any], figures: Tuple[Any, Any, Any]) -> List[Dict[str, Any]]:
+    """Chart sections for a LoL analysis"""
+    jungle_data = stats["jungle_proximity"]
+    obj_data = stats["objective_control"]
+    gold_data = stats["gold_efficiency"]
+    heatmap_fig, obj_timeline_fig, gold_fig = figures
+    return [
+        {
+            "title": "🌲 Jungle Proximity Heatmap",
+            "figure": heatmap_fig,
+            "columns": [
+                [("Top Lane", f"{jungle_data['top_lane_percent']:.1f}%", None)],
+                [("Mid Lane", f"{jungle_data['mid_lane_percent']:.1f}%", None)],
+                [("Bot Lane", f"{jungle_data['bot_lane_percent']:.1f}%", None)]
+            ],
+            "insight": jungle_data["insight"]
+        },
+        {
+            "title": "🐉 Objective Control Timeline",
+            "figure": obj_timeline_fig,
+            "columns": [
+                [("Dragons", f"{obj_data['team_dragons']}/{obj_data['total_dragons']}", None)],
+                [("Heralds", f"{obj_data['team_heralds']}/{obj_data['total_heralds']}", None)],
+                [("Barons", f"{obj_data['team_barons']}/{obj_data['total_barons']}", None)]
+            ],
+            "insight": obj_data["insight"]
+        },
+        {
+            "title": "💰 Gold Efficiency Over Time",
+            "figure": gold_fig,
+            "columns": [
+                [(f"@ {minute}min", f"{int(gold_data[f'gold_diff_at_{minute}min']):+d}g", None)]
+                for minute in (10, 15, 20)
+            ],
+            "insight": gold_data["insight"]
+        }
+    ]
+
+
+def _valorant_cards(stats: Dict[str, Any]) -> List[Tuple[str, str, str, str]]:
+    """Header stat cards for a VALORANT analysis"""
+    opening_data = stats["opening_duel_stats"]
+    eco_data = stats["economy_stats"]
+    return [
+        ("Match Win Rate", f"{stats['match_win_rate']:.1f}%", f"{stats['matches_analyzed']} matches",
+         utils.get_color_by_performance(stats["match_win_rate"], 60, 40)),
+        ("Round Win Rate", f"{stats['round_win_rate']:.1f}%", f"{stats['total_rounds_played']} rounds",
+         utils.get_color_by_performance(stats["round_win_rate"], 55, 45)),
+        ("First Blood Rate", f"{opening_data['first_blood_rate']:.0f}%", "Opening duel success",
+         utils.get_color_by_performance(opening_data["first_blood_rate"], 55, 45)),
+        ("Eco Conversion", f"{eco_data['eco_conversion_rate']:.0f}%", "Win rate on save rounds",
+         utils.get_color_by_performance(eco_data["eco_conversion_rate"], 20, 10))
+    ]
+
+
+def _valorant_sections(stats: Dict[str, Any], figures: Tuple[Any, Any]) -> List[Dict[str, Any]]:
+    """Chart sections for a VALORANT analysis"""
+    opening_data = stats["opening_duel_stats"]
+    site_data = stats["site_bias_stats"]
+    eco_data = stats["economy_stats"]
+    site_fig, eco_fig = figures
+    return [
+        {
+            "title": "⚔️ Opening Engagement Performance",
+            "figure": None,
+            "columns": [
+                [
+                    ("First Blood Rate", f"{opening_data['first_blood_rate']:.1f}%",
+                     f"Conversion: {opening_data['first_blood_conversion']:.1f}%"),
+                    ("Rounds Won WITH First Blood",
+                     f"{opening_data['rounds_won_with_fb']} / {opening_data['rounds_with_first_blood']}", None)
+                ],
+                [
+                    ("Rounds Won WITHOUT First Blood", f"{opening_data['rounds_won_without_fb']}", None),
+                    ("Total Rounds Analyzed", f"{opening_data['total_rounds']}", None)
+                ]
+            ],
+            "insight": opening_data["insight"]
+        },
+        {
+            "title": "🗺️ Site Attack Preferences",
+            "figure": site_fig,
+            "columns": [
+                [(f"{site}-Site", f"{site_data[f'site_{site}_percent']:.1f}%",
+                  f"{site_data[f'site_{site}_winrate']:.1f}% WR")]
+                for site in ("A", "B", "C")
+            ],
+            "insight": site_data["insight"]
+        },
+        {
+            "title": "💳 Economy Round Performance",
+            "figure": eco_fig,
+            "columns": [
+                [("Eco Rounds", f"{eco_data['eco_rounds_played']}", f"{eco_data['eco_conversion_rate']:.1f}% WR")],
+                [("Force Buy Rounds", f"{eco_data['force_rounds_played']}", f"{eco_data['force_buy_winrate']:.1f}% WR")],
+                [("Full Buy Rounds", f"{eco_data['full_buy_rounds_played']}", f"{eco_data['full_buy_winrate']:.1f}% WR")]
+            ],
+            "insight": eco_data["insight"]
+        }
+    ]
+
+
+# Everything that differs between the two games' report pages
+GAME_VIEWS = {
+    "League of Legends": {
+        "game": "lol",
+        "label": "LoL",
+        "analyze": _analyze_lol,
+        "figures": _lol_figures,
+        "cards": _lol_cards,
+        "sections": _lol_sections
+    },
+    "VALORANT": {
+        "game": "valorant",
+        "label": "VALORANT",
+        "analyze": _analyze_valorant,
+        "figures": _valorant_figures,
+        "cards": _valorant_cards,
+        "sections": _valorant_sections
+    }
+}
+
+
+def _card_row(cards: List[str]) -> None:
+    """Lay out single-line stat-card HTML side by side as one flex-row element"""
+    cells = "".join(f"<div style='flex:1 1 180px'>{card}</div>" for card in cards)
+    st.markdown(f"<div style='display:flex;flex-wrap:wrap;gap:12px'>{cells}</div>", unsafe_allow_html=True)
+
+
+def _render_analysis(view: Dict[str, Any], stats: Dict[str, Any], figures: Tuple) -> None:
+    """Render the stat cards and chart sections for one game's analysis"""
+    # Display header stats
+    _card_row([utils.format_stat_card(*card) for card in view["cards"](stats)])
+    
+    st.markdown("---")
+    st.header("📊 Statistical Analysis")
+    
+    for section in view["sections"](stats, figures):
+        st.subheader(section["title"])
+        if section["figure"] is not None:
+            st.plotly_chart(section["figure"])
+        
+        for column, metrics in zip(st.columns(len(section["columns"])), section["columns"]):
+            for label, value, delta in metrics:
+                column.metric(label, value, delta=delta)
+        
+        st.info(f"**Insight:** {section['insight']}")
+
 
 # Title
 st.title("🎯 VANGUARD")
@@ -87,12 +463,7 @@ with st.sidebar:
         st.caption("⚠️ Requires GRID Team ID (team name search not available)")
         
         # Try to get GRID API key from Streamlit secrets first
-        default_grid_key = ""
-        try:
-            default_grid_key = st.secrets.get("GRID_API_KEY", "")
-        except:
-            import os
-            default_grid_key = os.getenv("GRID_API_KEY", "")
+        default_grid_key = _default_key("GRID_API_KEY")
         
         grid_api_key = st.text_input(
             "GRID API Key",
@@ -111,10 +482,7 @@ with st.sidebar:
         if team_id_input:
             team_name = f"TeamID:{team_id_input}"
         
-        if grid_api_key:
-            import os
-            os.environ["GRID_API_KEY"] = grid_api_key
-        else:
+        if not grid_api_key:
             st.warning("⚠️ Please enter your GRID API key to use live data")
     else:
         st.success("✅ **Mock Mode Active**")
@@ -131,21 +499,14 @@ with st.sidebar:
     )
     
     # API key input (if needed)
+    api_key = None
     if llm_provider != "Mock (No API)":
         # Try to get API key from Streamlit secrets first, then environment variables
-        default_api_key = ""
-        if llm_provider == "OpenRouter (Gemma 3 27B - Free)":
-            try:
-                default_api_key = st.secrets.get("OPENROUTER_API_KEY", "")
-            except:
-                import os
-                default_api_key = os.getenv("OPENROUTER_API_KEY", "")
-        
         if llm_provider == "OpenRouter (Gemma 3 27B - Free)":
             api_key = st.text_input(
                 "OpenRouter API Key",
                 type="password",
-                value=default_api_key,
+                value=_default_key("OPENROUTER_API_KEY"),
                 help="OpenRouter API key (Gemma 3 27B is free!)"
             )
         else:
@@ -154,19 +515,11 @@ with st.sidebar:
                 type="password",
                 help="Enter your OpenAI or Google API key"
             )
-        
-        if llm_provider == "OpenAI GPT-4":
-            if api_key:
-                import os
-                os.environ["OPENAI_API_KEY"] = api_key
-        elif llm_provider == "Google Gemini":
-            if api_key:
-                import os
-                os.environ["GOOGLE_API_KEY"] = api_key
-        elif llm_provider == "OpenRouter (Gemma 3 27B - Free)":
-            if api_key:
-                import os
-                os.environ["OPENROUTER_API_KEY"] = api_key
+
+    # Keys stay in this session and are passed to each call, never written to os.environ
+    st.session_state.api_keys = {"grid": grid_api_key or ""}
+    if api_key:
+        st.session_state.api_keys[LLM_PROVIDERS[llm_provider]] = api_key
     
     # Generate button
     generate_button = st.button("🚀 Generate Scouting Report", type="primary")
@@ -184,291 +537,39 @@ if generate_button:
         with st.spinner(f"🔍 Analyzing {display_team}'s recent {num_matches} {game_type} matches..."):
             
             # Load data with appropriate mode
-            if use_live_api and grid_api_key:
+            use_live = bool(use_live_api and grid_api_key)
+            if use_live:
                 st.info("🔄 Connecting to GRID Central Data Feed...")
                 st.caption("📊 Fetching real tournament/team data + simulated in-game events")
-                loader = GridDataLoader(api_key=grid_api_key, use_mock=False)
             else:
                 st.info("🎮 Using Mock Data Mode")
                 st.caption("📊 Generating realistic demo data")
-                loader = GridDataLoader(use_mock=True)
+            grid_key_hash = _hash_key(grid_api_key)
+            
+            view = GAME_VIEWS[game_type]
+            matches, columns = _load_matches(view["game"], team_name, num_matches, use_live, grid_key_hash, _api_key=grid_api_key)
+            
+            if not matches:
+                st.error("❌ No match data found!")
+                st.stop()
+            
+            # Analyze; the content hash covers every event, so edited matches never reuse a stale entry
+            fingerprint = matches_fingerprint(matches)
+            stats = view["analyze"](fingerprint, matches, columns)
+            
+            # Start the AI report now; charts render while the LLM responds
+            report_chunks = queue.Queue()
+            report_future = _report_pool().submit(
+                _stream_report, report_chunks, stats, view["game"], LLM_PROVIDERS[llm_provider],
+                api_keys=st.session_state.api_keys
+            )
             
-            if game_type == "League of Legends":
-                # Load LoL data
-                matches = loader.load_lol_matches(team_name, num_matches)
-                
-                if not matches:
-                    st.error("❌ No match data found!")
-                    st.stop()
-                
-                # Analyze
-                analyzer = LolAnalyzer(matches)
-                stats = analyzer.get_complete_analysis()
-                
-                # Display header stats
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    win_color = utils.get_color_by_performance(stats["win_rate"], 60, 40)
-                    st.markdown(utils.format_stat_card(
-                        "Win Rate",
-                        f"{stats['win_rate']:.1f}%",
-                        f"{stats['matches_analyzed']} matches",
-                        win_color
-                    ), unsafe_allow_html=True)
-                
-                with col2:
-                    jungle_data = stats["jungle_proximity"]
-                    max_lane = max(
-                        jungle_data["top_lane_percent"],
-                        jungle_data["mid_lane_percent"],
-                        jungle_data["bot_lane_percent"]
-                    )
-                    st.markdown(utils.format_stat_card(
-                        "Jungle Focus",
-                        f"{max_lane:.0f}%",
-                        "Most prioritized lane",
-                        "#ffa94d"
-                    ), unsafe_allow_html=True)
-                
-                with col3:
-                    obj_data = stats["objective_control"]
-                    obj_color = utils.get_color_by_performance(obj_data["first_dragon_rate"], 60, 40)
-                    st.markdown(utils.format_stat_card(
-                        "First Dragon",
-                        f"{obj_data['first_dragon_rate']:.0f}%",
-                        "Control rate",
-                        obj_color
-                    ), unsafe_allow_html=True)
-                
-                with col4:
-                    gold_data = stats["gold_efficiency"]
-                    gold_15 = gold_data["gold_diff_at_15min"]
-                    gold_color = utils.get_color_by_performance(gold_15, 500, -500)
-                    st.markdown(utils.format_stat_card(
-                        "Gold @ 15min",
-                        f"{int(gold_15):+d}",
-                        "Average difference",
-                        gold_color
-                    ), unsafe_allow_html=True)
-                
-                st.markdown("---")
-                
-                # Visualizations
-                st.header("📊 Statistical Analysis")
-                
-                # Jungle Heatmap
-                st.subheader("🌲 Jungle Proximity Heatmap")
-                heatmap_fig = utils.create_jungle_heatmap(stats["jungle_proximity"]["heatmap_data"])
-                st.plotly_chart(heatmap_fig)
-                
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Top Lane", f"{jungle_data['top_lane_percent']:.1f}%")
-                with col2:
-                    st.metric("Mid Lane", f"{jungle_data['mid_lane_percent']:.1f}%")
-                with col3:
-                    st.metric("Bot Lane", f"{jungle_data['bot_lane_percent']:.1f}%")
-                
-                st.info(f"**Insight:** {jungle_data['insight']}")
-                
-                # Objective Timeline
-                st.subheader("🐉 Objective Control Timeline")
-                obj_timeline_fig = utils.create_objective_timeline(matches, team_name)
-                st.plotly_chart(obj_timeline_fig)
-                
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Dragons", f"{obj_data['team_dragons']}/{obj_data['total_dragons']}")
-                with col2:
-                    st.metric("Heralds", f"{obj_data['team_heralds']}/{obj_data['total_heralds']}")
-                with col3:
-                    st.metric("Barons", f"{obj_data['team_barons']}/{obj_data['total_barons']}")
-                
-                st.info(f"**Insight:** {obj_data['insight']}")
-                
-                # Gold Difference Chart
-                st.subheader("💰 Gold Efficiency Over Time")
-                gold_fig = utils.create_gold_diff_chart(matches)
-                st.plotly_chart(gold_fig)
-                
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("@ 10min", f"{int(gold_data['gold_diff_at_10min']):+d}g")
-                with col2:
-                    st.metric("@ 15min", f"{int(gold_data['gold_diff_at_15min']):+d}g")
-                with col3:
-                    st.metric("@ 20min", f"{int(gold_data['gold_diff_at_20min']):+d}g")
-                
-                st.info(f"**Insight:** {gold_data['insight']}")
-                
-                # Generate AI Report
-                st.markdown("---")
-                st.header("🤖 AI-Generated Scouting Report")
-                
-                with st.spinner("🧠 AI Scout is analyzing patterns and generating win conditions..."):
-                    provider_map = {
-                        "Mock (No API)": "mock",
-                        "OpenAI GPT-4": "openai",
-                        "Google Gemini": "gemini",
-                        "OpenRouter (Gemma 3 27B - Free)": "openrouter"
-                    }
-                    report = generate_scouting_report(stats, "lol", provider_map[llm_provider])
-                    
-                    st.markdown(report)
-                
-                # Download button for report
-                st.download_button(
-                    label="📥 Download Scouting Report",
-                    data=report,
-                    file_name=f"scouting_report_{team_name}_LoL.md",
-                    mime="text/markdown"
-                )
+            # Visualizations (figures are built together and reused across reruns)
+            figures = view["figures"](fingerprint, team_name, matches, columns, stats)
+            _render_analysis(view, stats, figures)
             
-            else:  # VALORANT
-                # Load VALORANT data
-                matches = loader.load_valorant_matches(team_name, num_matches)
-                
-                if not matches:
-                    st.error("❌ No match data found!")
-                    st.stop()
-                
-                # Analyze
-                analyzer = ValorantAnalyzer(matches)
-                stats = analyzer.get_complete_analysis()
-                
-                # Display header stats
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    win_color = utils.get_color_by_performance(stats["match_win_rate"], 60, 40)
-                    st.markdown(utils.format_stat_card(
-                        "Match Win Rate",
-                        f"{stats['match_win_rate']:.1f}%",
-                        f"{stats['matches_analyzed']} matches",
-                        win_color
-                    ), unsafe_allow_html=True)
-                
-                with col2:
-                    round_color = utils.get_color_by_performance(stats["round_win_rate"], 55, 45)
-                    st.markdown(utils.format_stat_card(
-                        "Round Win Rate",
-                        f"{stats['round_win_rate']:.1f}%",
-                        f"{stats['total_rounds_played']} rounds",
-                        round_color
-                    ), unsafe_allow_html=True)
-                
-                with col3:
-                    opening_data = stats["opening_duel_stats"]
-                    fb_color = utils.get_color_by_performance(opening_data["first_blood_rate"], 55, 45)
-                    st.markdown(utils.format_stat_card(
-                        "First Blood Rate",
-                        f"{opening_data['first_blood_rate']:.0f}%",
-                        "Opening duel success",
-                        fb_color
-                    ), unsafe_allow_html=True)
-                
-                with col4:
-                    eco_data = stats["economy_stats"]
-                    eco_color = utils.get_color_by_performance(eco_data["eco_conversion_rate"], 20, 10)
-                    st.markdown(utils.format_stat_card(
-                        "Eco Conversion",
-                        f"{eco_data['eco_conversion_rate']:.0f}%",
-                        "Win rate on save rounds",
-                        eco_color
-                    ), unsafe_allow_html=True)
-                
-                st.markdown("---")
-                
-                # Visualizations
-                st.header("📊 Statistical Analysis")
-                
-                # Opening Duel Stats
-                st.subheader("⚔️ Opening Engagement Performance")
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.metric(
-                        "First Blood Rate",
-                        f"{opening_data['first_blood_rate']:.1f}%",
-                        delta=f"Conversion: {opening_data['first_blood_conversion']:.1f}%"
-                    )
-                    st.metric(
-                        "Rounds Won WITH First Blood",
-                        f"{opening_data['rounds_won_with_fb']} / {opening_data['rounds_with_first_blood']}"
-                    )
-                
-                with col2:
-                    st.metric(
-                        "Rounds Won WITHOUT First Blood",
-                        f"{opening_data['rounds_won_without_fb']}"
-                    )
-                    st.metric(
-                        "Total Rounds Analyzed",
-                        f"{opening_data['total_rounds']}"
-                    )
-                
-                st.info(f"**Insight:** {opening_data['insight']}")
-                
-                # Site Bias Analysis
-                st.subheader("🗺️ Site Attack Preferences")
-                site_data = stats["site_bias_stats"]
-                site_fig = utils.create_site_bias_chart(site_data)
-                st.plotly_chart(site_fig)
-                
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("A-Site", f"{site_data['site_A_percent']:.1f}%", 
-                             delta=f"{site_data['site_A_winrate']:.1f}% WR")
-                with col2:
-                    st.metric("B-Site", f"{site_data['site_B_percent']:.1f}%",
-                             delta=f"{site_data['site_B_winrate']:.1f}% WR")
-                with col3:
-                    st.metric("C-Site", f"{site_data['site_C_percent']:.1f}%",
-                             delta=f"{site_data['site_C_winrate']:.1f}% WR")
-                
-                st.info(f"**Insight:** {site_data['insight']}")
-                
-                # Economy Analysis
-                st.subheader("💳 Economy Round Performance")
-                eco_fig = utils.create_economy_chart(eco_data)
-                st.plotly_chart(eco_fig)
-                
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Eco Rounds", f"{eco_data['eco_rounds_played']}",
-                             delta=f"{eco_data['eco_conversion_rate']:.1f}% WR")
-                with col2:
-                    st.metric("Force Buy Rounds", f"{eco_data['force_rounds_played']}",
-                             delta=f"{eco_data['force_buy_winrate']:.1f}% WR")
-                with col3:
-                    st.metric("Full Buy Rounds", f"{eco_data['full_buy_rounds_played']}",
-                             delta=f"{eco_data['full_buy_winrate']:.1f}% WR")
-                
-                st.info(f"**Insight:** {eco_data['insight']}")
-                
-                # Generate AI Report
-                st.markdown("---")
-                st.header("🤖 AI-Generated Scouting Report")
-                
-                with st.spinner("🧠 AI Scout is analyzing patterns and generating win conditions..."):
-                    provider_map = {
-                        "Mock (No API)": "mock",
-                        "OpenAI GPT-4": "openai",
-                        "Google Gemini": "gemini",
-                        "OpenRouter (Gemma 3 27B - Free)": "openrouter"
-                    }
-                    report = generate_scouting_report(stats, "valorant", provider_map[llm_provider])
-                    
-                    st.markdown(report)
-                
-                # Download button for report
-                st.download_button(
-                    label="📥 Download Scouting Report",
-                    data=report,
-                    file_name=f"scouting_report_{team_name}_VALORANT.md",
-                    mime="text/markdown"
-                )
+            # Generate AI Report
+            _report_section(report_future, report_chunks, team_name, view["label"])
     
     except Exception as e:
         st.error("❌ An error occurred while generating the report")
@@ -489,46 +590,15 @@ if generate_button:
         else:
             st.info("💡 **Tip:** Try using mock data mode (uncheck 'Use Live GRID API') to test the system.")
         
-        # Show traceback in expander for debugging
-        with st.expander("🔧 Technical Details (for debugging)"):
-            import traceback
-            st.code(traceback.format_exc())
+        # Formatting the traceback walks every frame, so only do it when debugging
+        if DEBUG_MODE:
+            with st.expander("🔧 Technical Details (for debugging)"):
+                import traceback
+                st.code(traceback.format_exc())
 
 else:
     # Landing page
-    st.markdown("""
-    ## 👋 Welcome to Vanguard
-    
-    **Vanguard** is a God-Tier automated esports scouting system that provides "Moneyball-style" 
-    statistical analysis for competitive gaming teams.
-    
-    ### 🎮 Supported Games
-    - **League of Legends**: Jungle proximity heatmaps, objective control rates, gold efficiency
-    - **VALORANT**: Opening duel statistics, site bias analysis, economy conversion rates
-    
-    ### 🤖 AI-Powered Insights
-    Our LLM-based "Agentic Scout" analyzes your statistical data and generates:
-    - **Pattern Recognition**: Identifies exploitable weaknesses
-    - **Win Condition Strategy**: Specific, actionable counter-strategies
-    - **Timing Windows**: Exact timeframes to execute your game plan
-    - **Target Priorities**: Who and what to focus on
-    
-    ### 🚀 Getting Started
-    1. Select your game (LoL or VALORANT) in the sidebar
-    2. Enter the team name you want to analyze
-    3. Choose how many recent matches to include
-    4. Click **"Generate Scouting Report"**
-    
-    ### 📊 What You'll Get
-    - Interactive heatmaps and charts
-    - Comprehensive statistical breakdowns
-    - AI-generated coaching insights
-    - Downloadable markdown reports
-    
-    ---
-    
-    **Ready to dominate?** Configure your settings in the sidebar and click the generate button! 🎯
-    """)
+    st.markdown(_LANDING_MARKDOWN)
     
     # Sample visualizations (placeholder)
     col1, col2 = st.columns(2)
@@ -541,9 +611,4 @@ else:
 
 # Footer
 st.markdown("---")
-st.markdown("""
-<div style='text-align: center; color: #8b8d98;'>
-    <p><strong>Vanguard</strong> - Moneyball for Esports</p>
-    <p>Built for Sky Is The Limit Hackathon 2026 | Powered by GRID Esports API & AI</p>
-</div>
-""", unsafe_allow_html=True)
+st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
@@ -3,8 +3,39 @@ Mock Data Generators for League of Legends and VALORANT
 Generates realistic game data for testing the scouting system
 """
 import random
-from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+import numpy as np
+
+# LoL objective timings and pit locations
+DRAGON_SPAWN_TIMES = np.array([300, 600, 900, 1200, 1500, 1800, 2100, 2400])  # seconds
+DRAGON_TYPES = ("Cloud", "Infernal", "Ocean", "Mountain", "Elder")
+DRAGON_PIT = (9800, 4200)
+BARON_PIT = (5200, 10400)  # Rift Herald shares the pit
+
+# Jungler coordinate boxes per lane: rows are Top, Mid, Bot; columns are inclusive (x_lo, y_lo, x_hi, y_hi)
+JUNGLE_LANES = ("Top", "Mid", "Bot")
+JUNGLE_BOXES = np.array([[1000, 10000, 7000, 14000], [5000, 5000, 10000, 10000], [8000, 1000, 14000, 5000]])
+
+# VALORANT loadout tiers (Eco, Force Buy, Full Buy) as inclusive credit ranges
+LOADOUT_RANGES = np.array([[800, 1500], [2000, 3000], [3500, 5000]])
+PISTOL_ROUNDS = np.array([0, 12])  # zero-based: rounds 1 and 13
+
+# Spike sites and their plant coordinate boxes, rows in SPIKE_SITES order, columns as JUNGLE_BOXES
+SPIKE_SITES = ("A", "B", "C")
+SPIKE_BOXES = np.array([[20, 40, 35, 55], [55, 20, 70, 35], [40, 60, 55, 75]])
+VALORANT_MAPS = ("Ascent", "Bind", "Haven", "Split", "Icebox", "Breeze", "Fracture")
+
+
+def _match_dates(num_matches: int, days_apart: int) -> List[str]:
+    """ISO timestamps for matches 1..num_matches, each days_apart further back from now"""
+    now = np.datetime64(datetime.now(), "us")
+    return (now - np.arange(1, num_matches + 1) * np.timedelta64(days_apart, "D")).astype(str).tolist()
+
+
+def _rng(seed: Optional[int] = None) -> np.random.Generator:
+    """NumPy generator for seed, else seeded from the random module so random.seed() still reproduces a run"""
+    return np.random.default_rng(random.getrandbits(64) if seed is None else seed)
 
 
 class MockDataGenerator:
@@ -17,141 +48,139 @@ class MockDataGenerator:
     VALORANT_MAP_SIZE = 100
     
     @staticmethod
-    def generate_lol_match_data(team_name: str = "Cloud9", num_matches: int = 10) -> List[Dict[str, Any]]:
+    def generate_lol_match_data(team_name: str = "Cloud9", num_matches: int = 10,
+                                seed: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Generate realistic League of Legends match data
         
+        Args:
+            team_name: Team the matches are generated for
+            num_matches: Number of matches to generate
+            seed: Seed for reproducible output (same seed, same matches apart from dates)
+            
         Returns:
             List of match dictionaries with timestamped events
         """
+        rng = _rng(seed)
+        match_dates = _match_dates(num_matches, days_apart=3)
         matches = []
         
         for match_id in range(1, num_matches + 1):
-            match_date = datetime.now() - timedelta(days=match_id * 3)
-            
             # Generate match outcome (70% win rate for testing)
-            won = random.random() < 0.7
-            game_duration = random.randint(1500, 2400)  # 25-40 minutes in seconds
+            won = bool(rng.random() < 0.7)
+            game_duration = int(rng.integers(1500, 2401))  # 25-40 minutes in seconds
             
             # Generate kills (with coordinates)
-            kills = []
-            num_kills = random.randint(15, 35) if won else random.randint(8, 20)
-            
-            for k in range(num_kills):
-                timestamp = random.randint(180, game_duration)  # Kills start after 3 min
-                kills.append({
+            num_kills = int(rng.integers(15, 36) if won else rng.integers(8, 21))
+            kill_times = np.sort(rng.integers(180, game_duration + 1, num_kills))  # Kills start after 3 min
+            kill_xy = rng.integers(1000, MockDataGenerator.LOL_MAP_SIZE - 999, (2, num_kills))
+            kills = [
+                {
                     "timestamp": timestamp,
                     "killer": team_name,
                     "victim": "Enemy Team",
-                    "x": random.randint(1000, MockDataGenerator.LOL_MAP_SIZE - 1000),
-                    "y": random.randint(1000, MockDataGenerator.LOL_MAP_SIZE - 1000),
+                    "x": x,
+                    "y": y,
                     "is_first_blood": k == 0
-                })
+                }
+                for k, (timestamp, x, y) in enumerate(zip(kill_times.tolist(), *kill_xy.tolist()))
+            ]
             
             # Generate Dragon kills (Dragons spawn every 5 minutes starting at 5:00)
-            dragons = []
-            dragon_spawn_times = [300, 600, 900, 1200, 1500, 1800, 2100, 2400]
-            dragon_locations = [(9800, 4200)]  # Dragon pit location
-            
-            for spawn_time in dragon_spawn_times:
-                if spawn_time < game_duration and random.random() < 0.8:
-                    taken_by_team = random.random() < (0.75 if won else 0.35)
-                    dragons.append({
-                        "timestamp": spawn_time + random.randint(0, 120),
-                        "team": team_name if taken_by_team else "Enemy Team",
-                        "dragon_type": random.choice(["Cloud", "Infernal", "Ocean", "Mountain", "Elder"]),
-                        "x": dragon_locations[0][0],
-                        "y": dragon_locations[0][1]
-                    })
+            # The 0-120s take delay is shorter than the spawn gap, so times stay in spawn order
+            spawned = (DRAGON_SPAWN_TIMES < game_duration) & (rng.random(len(DRAGON_SPAWN_TIMES)) < 0.8)
+            num_dragons = int(spawned.sum())
+            dragon_times = DRAGON_SPAWN_TIMES[spawned] + rng.integers(0, 121, num_dragons)
+            dragon_taken = rng.random(num_dragons) < (0.75 if won else 0.35)
+            dragon_kinds = rng.integers(0, len(DRAGON_TYPES), num_dragons)
+            dragons = [
+                {
+                    "timestamp": timestamp,
+                    "team": team_name if taken_by_team else "Enemy Team",
+                    "dragon_type": DRAGON_TYPES[kind],
+                    "x": DRAGON_PIT[0],
+                    "y": DRAGON_PIT[1]
+                }
+                for timestamp, taken_by_team, kind in zip(dragon_times.tolist(), dragon_taken.tolist(), dragon_kinds.tolist())
+            ]
             
             # Generate Baron kills (Baron spawns at 20:00)
             barons = []
             if game_duration > 1200:
-                num_barons = random.randint(0, 2)
-                baron_location = (5200, 10400)  # Baron pit location
-                
-                for b in range(num_barons):
-                    timestamp = random.randint(1200, game_duration - 60)
-                    taken_by_team = random.random() < (0.8 if won else 0.2)
-                    barons.append({
+                num_barons = int(rng.integers(0, 3))
+                baron_times = np.sort(rng.integers(1200, game_duration - 59, num_barons))
+                baron_taken = rng.random(num_barons) < (0.8 if won else 0.2)
+                barons = [
+                    {
                         "timestamp": timestamp,
                         "team": team_name if taken_by_team else "Enemy Team",
-                        "x": baron_location[0],
-                        "y": baron_location[1]
-                    })
+                        "x": BARON_PIT[0],
+                        "y": BARON_PIT[1]
+                    }
+                    for timestamp, taken_by_team in zip(baron_times.tolist(), baron_taken.tolist())
+                ]
             
             # Generate Rift Herald kills (spawns at 8:00, despawns at 19:45)
             heralds = []
             if game_duration > 480:
-                num_heralds = random.randint(0, 2)
-                herald_location = (5200, 10400)
-                
-                for h in range(num_heralds):
-                    timestamp = random.randint(480, min(1185, game_duration))
-                    taken_by_team = random.random() < (0.7 if won else 0.3)
-                    heralds.append({
+                num_heralds = int(rng.integers(0, 3))
+                herald_times = np.sort(rng.integers(480, min(1185, game_duration) + 1, num_heralds))
+                herald_taken = rng.random(num_heralds) < (0.7 if won else 0.3)
+                heralds = [
+                    {
                         "timestamp": timestamp,
                         "team": team_name if taken_by_team else "Enemy Team",
-                        "x": herald_location[0],
-                        "y": herald_location[1]
-                    })
+                        "x": BARON_PIT[0],
+                        "y": BARON_PIT[1]
+                    }
+                    for timestamp, taken_by_team in zip(herald_times.tolist(), herald_taken.tolist())
+                ]
             
             # Generate gold updates (every 5 minutes)
-            gold_updates = []
             base_gold_advantage = 500 if won else -500
-            
-            for minute in range(5, game_duration // 60 + 1, 5):
-                variance = random.randint(-300, 300)
-                gold_diff = base_gold_advantage + variance + (minute * 50)
-                gold_updates.append({
+            minutes = np.arange(5, game_duration // 60 + 1, 5)
+            gold_diffs = base_gold_advantage + rng.integers(-300, 301, len(minutes)) + minutes * 50
+            gold_updates = [
+                {
                     "timestamp": minute * 60,
                     "team_gold": 15000 + (minute * 300) + gold_diff,
                     "enemy_gold": 15000 + (minute * 300),
                     "gold_difference": gold_diff
-                })
+                }
+                for minute, gold_diff in zip(minutes.tolist(), gold_diffs.tolist())
+            ]
             
             # Generate jungle proximity data (tracking jungler position)
-            jungle_positions = []
-            num_position_samples = random.randint(100, 200)
-            
-            for _ in range(num_position_samples):
-                timestamp = random.randint(0, game_duration)
-                # Divide map into lanes: Top (y > 10000), Mid (center), Bot (y < 5000)
-                lane_bias = random.random()
-                
-                if lane_bias < 0.35:  # Top lane
-                    x = random.randint(1000, 7000)
-                    y = random.randint(10000, 14000)
-                    lane = "Top"
-                elif lane_bias < 0.70:  # Mid lane
-                    x = random.randint(5000, 10000)
-                    y = random.randint(5000, 10000)
-                    lane = "Mid"
-                else:  # Bot lane
-                    x = random.randint(8000, 14000)
-                    y = random.randint(1000, 5000)
-                    lane = "Bot"
-                
-                jungle_positions.append({
+            # Lanes: Top (35%), Mid (35%), Bot (30%), each with its own coordinate box
+            num_position_samples = int(rng.integers(100, 201))
+            position_times = np.sort(rng.integers(0, game_duration + 1, num_position_samples))
+            lane_bias = rng.random(num_position_samples)
+            lane_ids = (lane_bias >= 0.35).astype(np.intp) + (lane_bias >= 0.70)
+            boxes = JUNGLE_BOXES[lane_ids]
+            xs, ys = rng.integers(boxes[:, :2], boxes[:, 2:] + 1).T
+            jungle_positions = [
+                {
                     "timestamp": timestamp,
                     "x": x,
                     "y": y,
-                    "lane": lane
-                })
+                    "lane": JUNGLE_LANES[lane_id]
+                }
+                for timestamp, x, y, lane_id in zip(position_times.tolist(), xs.tolist(), ys.tolist(), lane_ids.tolist())
+            ]
             
             match_data = {
                 "match_id": f"LOL_{match_id}",
-                "date": match_date.isoformat(),
+                "date": match_dates[match_id - 1],
                 "team": team_name,
                 "opponent": f"Team_{match_id}",
                 "won": won,
                 "duration": game_duration,
-                "kills": sorted(kills, key=lambda k: k["timestamp"]),
-                "dragons": sorted(dragons, key=lambda d: d["timestamp"]),
-                "barons": sorted(barons, key=lambda b: b["timestamp"]),
-                "heralds": sorted(heralds, key=lambda h: h["timestamp"]),
-                "gold_updates": sorted(gold_updates, key=lambda g: g["timestamp"]),
-                "jungle_positions": sorted(jungle_positions, key=lambda j: j["timestamp"])
+                "kills": kills,
+                "dragons": dragons,
+                "barons": barons,
+                "heralds": heralds,
+                "gold_updates": gold_updates,
+                "jungle_positions": jungle_positions
             }
             
             matches.append(match_data)
@@ -159,101 +188,86 @@ class MockDataGenerator:
         return matches
     
     @staticmethod
-    def generate_valorant_match_data(team_name: str = "Cloud9", num_matches: int = 10) -> List[Dict[str, Any]]:
+    def generate_valorant_match_data(team_name: str = "Cloud9", num_matches: int = 10,
+                                     seed: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Generate realistic VALORANT match data
         
+        Args:
+            team_name: Team the matches are generated for
+            num_matches: Number of matches to generate
+            seed: Seed for reproducible output (same seed, same matches apart from dates)
+            
         Returns:
             List of match dictionaries with round-by-round data
         """
+        rng = _rng(seed)
+        match_dates = _match_dates(num_matches, days_apart=2)
         matches = []
         
         for match_id in range(1, num_matches + 1):
-            match_date = datetime.now() - timedelta(days=match_id * 2)
-            
             # VALORANT is first to 13 rounds
-            team_rounds_won = random.randint(13, 15) if random.random() < 0.7 else random.randint(8, 12)
-            enemy_rounds_won = 13 if team_rounds_won < 13 else random.randint(8, 12)
+            team_rounds_won = int(rng.integers(13, 16) if rng.random() < 0.7 else rng.integers(8, 13))
+            enemy_rounds_won = 13 if team_rounds_won < 13 else int(rng.integers(8, 13))
             total_rounds = team_rounds_won + enemy_rounds_won
             
             won = team_rounds_won > enemy_rounds_won
             
-            # Generate round-by-round data
-            rounds = []
+            # Determine round winners
+            rounds_won = rng.random(total_rounds) < (team_rounds_won / total_rounds)
             
-            for round_num in range(1, total_rounds + 1):
-                # Determine round winner
-                round_won = random.random() < (team_rounds_won / total_rounds)
-                
-                # Economy system (Eco, Force Buy, Full Buy)
-                if round_num == 1 or round_num == 13:  # Pistol rounds
-                    team_loadout_value = 800
-                    enemy_loadout_value = 800
-                else:
-                    # Simulate economy cycles
-                    team_loadout_value = random.choice([
-                        random.randint(800, 1500),    # Eco (20%)
-                        random.randint(2000, 3000),   # Force Buy (30%)
-                        random.randint(3500, 5000)    # Full Buy (50%)
-                    ])
-                    enemy_loadout_value = random.choice([
-                        random.randint(800, 1500),
-                        random.randint(2000, 3000),
-                        random.randint(3500, 5000)
-                    ])
-                
-                # Spike plant location (A, B, or C site - map dependent)
-                sites = ["A", "B", "C"]
-                spike_planted = random.random() < 0.85
-                spike_site = random.choice(sites) if spike_planted else None
-                
-                # Spike plant coordinates (if planted)
-                spike_coords = None
-                if spike_planted:
-                    if spike_site == "A":
-                        spike_coords = {"x": random.randint(20, 35), "y": random.randint(40, 55)}
-                    elif spike_site == "B":
-                        spike_coords = {"x": random.randint(55, 70), "y": random.randint(20, 35)}
-                    else:  # C site
-                        spike_coords = {"x": random.randint(40, 55), "y": random.randint(60, 75)}
-                
-                # First blood
-                first_blood_team = random.choice([team_name, "Enemy Team"])
-                first_blood_location = {
-                    "x": random.randint(10, 90),
-                    "y": random.randint(10, 90)
-                }
-                
-                # Determine if this was an eco round for either team
-                is_team_eco = team_loadout_value < 2000
-                is_enemy_eco = enemy_loadout_value < 2000
-                
-                round_data = {
-                    "round_number": round_num,
-                    "winner": team_name if round_won else "Enemy Team",
-                    "team_loadout_value": team_loadout_value,
-                    "enemy_loadout_value": enemy_loadout_value,
-                    "is_team_eco": is_team_eco,
-                    "is_enemy_eco": is_enemy_eco,
-                    "spike_planted": spike_planted,
-                    "spike_site": spike_site,
-                    "spike_coords": spike_coords,
-                    "first_blood_team": first_blood_team,
-                    "first_blood_location": first_blood_location,
-                    "round_duration": random.randint(30, 100)  # seconds
+            # Economy system (Eco, Force Buy, Full Buy), one tier drawn per round and side
+            tiers = rng.integers(0, len(LOADOUT_RANGES), (2, total_rounds))
+            loadouts = rng.integers(LOADOUT_RANGES[tiers, 0], LOADOUT_RANGES[tiers, 1] + 1)
+            loadouts[:, PISTOL_ROUNDS[PISTOL_ROUNDS < total_rounds]] = 800
+            
+            # Spike plant location (A, B, or C site - map dependent) and coordinates
+            spike_planted = rng.random(total_rounds) < 0.85
+            site_ids = rng.integers(0, len(SPIKE_SITES), total_rounds)
+            boxes = SPIKE_BOXES[site_ids]
+            spike_xy = rng.integers(boxes[:, :2], boxes[:, 2:] + 1)
+            
+            # First blood
+            team_first_blood = rng.random(total_rounds) < 0.5
+            first_blood_xy = rng.integers(10, 91, (2, total_rounds))
+            round_durations = rng.integers(30, 101, total_rounds)  # seconds
+            
+            # Assemble the round dictionaries from plain Python lists
+            rounds_won = rounds_won.tolist()
+            team_loadouts, enemy_loadouts = loadouts.tolist()
+            spike_planted, site_ids = spike_planted.tolist(), site_ids.tolist()
+            spike_xs, spike_ys = spike_xy.T.tolist()
+            team_first_blood = team_first_blood.tolist()
+            first_blood_xs, first_blood_ys = first_blood_xy.tolist()
+            round_durations = round_durations.tolist()
+            
+            rounds = [
+                {
+                    "round_number": i + 1,
+                    "winner": team_name if rounds_won[i] else "Enemy Team",
+                    "team_loadout_value": team_loadouts[i],
+                    "enemy_loadout_value": enemy_loadouts[i],
+                    "is_team_eco": team_loadouts[i] < 2000,
+                    "is_enemy_eco": enemy_loadouts[i] < 2000,
+                    "spike_planted": spike_planted[i],
+                    "spike_site": SPIKE_SITES[site_ids[i]] if spike_planted[i] else None,
+                    "spike_coords": {"x": spike_xs[i], "y": spike_ys[i]} if spike_planted[i] else None,
+                    "first_blood_team": team_name if team_first_blood[i] else "Enemy Team",
+                    "first_blood_location": {"x": first_blood_xs[i], "y": first_blood_ys[i]},
+                    "round_duration": round_durations[i]
                 }
-                
-                rounds.append(round_data)
+                for i in range(total_rounds)
+            ]
             
             match_data = {
                 "match_id": f"VAL_{match_id}",
-                "date": match_date.isoformat(),
+                "date": match_dates[match_id - 1],
                 "team": team_name,
                 "opponent": f"Team_{match_id}",
                 "team_score": team_rounds_won,
                 "enemy_score": enemy_rounds_won,
                 "won": won,
-                "map": random.choice(["Ascent", "Bind", "Haven", "Split", "Icebox", "Breeze", "Fracture"]),
+                "map": VALORANT_MAPS[int(rng.integers(len(VALORANT_MAPS)))],
                 "rounds": rounds
             }
             
@@ -263,14 +277,16 @@ class MockDataGenerator:
 
 
 # Convenience functions for quick access
-def get_lol_mock_data(team_name: str = "Cloud9", num_matches: int = 10) -> List[Dict[str, Any]]:
+def get_lol_mock_data(team_name: str = "Cloud9", num_matches: int = 10,
+                      seed: Optional[int] = None) -> List[Dict[str, Any]]:
     """Quick function to get LoL mock data"""
-    return MockDataGenerator.generate_lol_match_data(team_name, num_matches)
+    return MockDataGenerator.generate_lol_match_data(team_name, num_matches, seed)
 
 
-def get_valorant_mock_data(team_name: str = "Cloud9", num_matches: int = 10) -> List[Dict[str, Any]]:
+def get_valorant_mock_data(team_name: str = "Cloud9", num_matches: int = 10,
+                           seed: Optional[int] = None) -> List[Dict[str, Any]]:
     """Quick function to get VALORANT mock data"""
-    return MockDataGenerator.generate_valorant_match_data(team_name, num_matches)
+    return MockDataGenerator.generate_valorant_match_data(team_name, num_matches, seed)
 
 
 if __name__ == "__main__":
@@ -3,38 +3,26 @@ Quick test script to verify all components are working
 Run this before launching the main app
 """
 import sys
+from importlib.util import find_spec
+
+# Required packages: (import/pip name, display name)
+REQUIRED_MODULES = (
+    ("pandas", "Pandas"),
+    ("plotly", "Plotly"),
+    ("streamlit", "Streamlit"),
+    ("numpy", "NumPy")
+)
+
 
 def test_imports():
-    """Test if all required modules can be imported"""
+    """Test if all required modules are installed, without importing them"""
     print("🔍 Testing imports...")
     
-    try:
-        import pandas as pd
-        print("  ✅ Pandas")
-    except ImportError:
-        print("  ❌ Pandas not found. Run: pip install pandas")
-        return False
-    
-    try:
-        import plotly
-        print("  ✅ Plotly")
-    except ImportError:
-        print("  ❌ Plotly not found. Run: pip install plotly")
-        return False
-    
-    try:
-        import streamlit
-        print("  ✅ Streamlit")
-    except ImportError:
-        print("  ❌ Streamlit not found. Run: pip install streamlit")
-        return False
-    
-    try:
-        import numpy
-        print("  ✅ NumPy")
-    except ImportError:
-        print("  ❌ NumPy not found. Run: pip install numpy")
-        return False
+    for module, label in REQUIRED_MODULES:
+        if find_spec(module) is None:
+            print(f"  ❌ {label} not found. Run: pip install {module}")
+            return False
+        print(f"  ✅ {label}")
     
     return True
 
@@ -44,6 +32,7 @@ def test_mock_data():
     print("\n🎮 Testing mock data generation...")
     
     try:
+        import copy
         from mock_data import get_lol_mock_data, get_valorant_mock_data
         
         lol_data = get_lol_mock_data(num_matches=3)
@@ -56,6 +45,16 @@ def test_mock_data():
         print(f"     - Sample match: {val_data[0]['match_id']}")
         print(f"     - Score: {val_data[0]['team_score']}-{val_data[0]['enemy_score']}")
         
+        # Mock loads come from a shared pool; a caller's edits must not reach the next load
+        from loaders import GridDataLoader
+        loader = GridDataLoader(use_mock=True)
+        loaded = loader.load_lol_matches("Pool Test", num_matches=3)
+        original = copy.deepcopy(loaded[0])
+        loaded[0]["kills"].clear()
+        loaded[0]["won"] = None
+        assert loader.load_lol_matches("Pool Test", num_matches=3)[0] == original
+        print(f"  ✅ Mock loads are isolated from earlier callers")
+        
         return True
     except Exception as e:
         print(f"  ❌ Error: {e}")
@@ -94,6 +93,232 @@ def test_analyzers():
         return False
 
 
+def test_columnar_analysis():
+    """Test that the columnar analyzers match statistics computed straight from the match dicts"""
+    print("\n🧮 Testing columnar analysis against the match dicts...")
+    
+    try:
+        from mock_data import get_lol_mock_data, get_valorant_mock_data
+        from analyzers import LolAnalyzer, ValorantAnalyzer
+        from loaders import GridDataLoader
+        from jsonio import canonical_json
+        
+        pct = lambda part, whole: round(part / whole * 100, 1) if whole else 0
+        
+        lol_matches = get_lol_mock_data(num_matches=12, seed=7)
+        team = lol_matches[0]["team"]
+        first_dragons = [match["dragons"][0]["team"] == team for match in lol_matches if match["dragons"]]
+        dragons = [dragon["team"] == team for match in lol_matches for dragon in match["dragons"]]
+        lol_stats = LolAnalyzer(lol_matches).get_complete_analysis()
+        assert lol_stats["win_rate"] == pct(sum(match["won"] for match in lol_matches), len(lol_matches))
+        assert lol_stats["objective_control"]["first_dragon_rate"] == pct(sum(first_dragons), len(first_dragons))
+        assert lol_stats["objective_control"]["overall_dragon_rate"] == pct(sum(dragons), len(dragons))
+        print("  ✅ LoL win and dragon rates match the dicts")
+        
+        val_matches = get_valorant_mock_data(num_matches=12, seed=7)
+        team = val_matches[0]["team"]
+        rounds = [round_["winner"] == team for match in val_matches for round_ in match["rounds"]]
+        val_stats = ValorantAnalyzer(val_matches).get_complete_analysis()
+        assert val_stats["match_win_rate"] == pct(sum(match["won"] for match in val_matches), len(val_matches))
+        assert val_stats["total_rounds_played"] == len(rounds)
+        assert val_stats["round_win_rate"] == pct(sum(rounds), len(rounds))
+        print("  ✅ VALORANT match and round win rates match the dicts")
+        
+        # Columns prebuilt by the loader must give the same analysis as columns built from the dicts
+        # (compared as canonical JSON, since the heatmap samples are NumPy arrays)
+        loader = GridDataLoader(use_mock=True)
+        for load, analyzer_cls in ((loader.load_lol_matches_with_columns, LolAnalyzer),
+                                   (loader.load_valorant_matches_with_columns, ValorantAnalyzer)):
+            matches, columns = load("Columns Test", 10)
+            prebuilt = analyzer_cls(matches, columns=columns).get_complete_analysis()
+            assert canonical_json(prebuilt) == canonical_json(analyzer_cls(matches).get_complete_analysis())
+        print("  ✅ Loader-built columns give the same analysis")
+        
+        return True
+    except Exception as e:
+        print(f"  ❌ Error: {e!r}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_analysis_cache():
+    """Test that cached analyses track event changes and stay isolated from callers"""
+    print("\n🗃️  Testing analysis cache...")
+    
+    try:
+        import copy
+        from mock_data import get_lol_mock_data
+        from analyzers import analyze_lol_team
+        
+        matches = get_lol_mock_data(num_matches=5)
+        stats = analyze_lol_team(matches)
+        
+        # Only the event lists change; the per-match summary fields stay the same
+        no_dragons = copy.deepcopy(matches)
+        for match in no_dragons:
+            match["dragons"] = []
+        assert analyze_lol_team(no_dragons)["objective_control"] != stats["objective_control"]
+        print("  ✅ Edited events miss the cache")
+        
+        stats["win_rate"] = -1.0
+        stats["objective_control"].clear()
+        fresh = analyze_lol_team(matches)
+        assert fresh["win_rate"] >= 0 and fresh["objective_control"]
+        print("  ✅ Mutating a result leaves the cached analysis intact")
+        
+        return True
+    except Exception as e:
+        print(f"  ❌ Error: {e!r}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_stats_revalidation():
+    """Test that expired GRID statistics are revalidated with their ETag"""
+    print("\n🏷️  Testing GRID statistics revalidation...")
+    
+    import json
+    import tempfile
+    import loaders
+    
+    saved_dir = loaders.GRID_CACHE_DIR
+    saved_ttl = loaders.GRID_CACHE_TTL
+    stats = {"series": {"count": 4}, "game": {"count": 9, "wins": [{"value": True, "percentage": 55.6}]}}
+    
+    class StubResponse:
+        def __init__(self, status_code, body=None, etag=None):
+            self.status_code = status_code
+            self.content = json.dumps(body).encode() if body is not None else b""
+            self.headers = {"ETag": etag} if etag else {}
+        
+        def raise_for_status(self):
+            if self.status_code >= 400:
+                raise RuntimeError(f"HTTP {self.status_code}")
+    
+    class StubSession:
+        def __init__(self):
+            self.sent_headers = []
+        
+        def post(self, url, data=None, headers=None, timeout=None):
+            self.sent_headers.append(dict(headers or {}))
+            if (headers or {}).get("If-None-Match") == '"v1"':
+                return StubResponse(304)
+            return StubResponse(200, {"data": {"teamStatistics": stats}}, etag='"v1"')
+    
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            loaders.GRID_CACHE_DIR = cache_dir
+            loaders._get_stats_cache.cache_clear()
+            loaders._STATS_MEMORY_CACHE.clear()
+            loader = loaders.GridDataLoader(api_key="test-key", use_mock=False)
+            loader._session = StubSession()
+            
+            assert loader._fetch_team_statistics("83", "lol") == stats
+            assert "If-None-Match" not in loader._session.sent_headers[0]
+            print("  ✅ First fetch stores the statistics with their ETag")
+            
+            assert loader._fetch_team_statistics("83", "lol") == stats
+            assert len(loader._session.sent_headers) == 1
+            print("  ✅ Fresh entry served without a request")
+            
+            loaders.GRID_CACHE_TTL = 0
+            assert loader._fetch_team_statistics("83", "lol") == stats
+            assert loader._session.sent_headers[1].get("If-None-Match") == '"v1"'
+            print("  ✅ Expired entry revalidated; 304 reuses the cached statistics")
+            
+            cache = loaders._get_stats_cache()
+            if cache is not None:
+                cache.close()
+        
+        return True
+    except Exception as e:
+        print(f"  ❌ Error: {e!r}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        loaders.GRID_CACHE_DIR = saved_dir
+        loaders.GRID_CACHE_TTL = saved_ttl
+        loaders._get_stats_cache.cache_clear()
+        loaders._STATS_MEMORY_CACHE.clear()
+
+
+def test_load_many():
+    """Test that load_many fetches each team's statistics once, failures included"""
+    print("\n🚚 Testing concurrent loading...")
+    
+    import json
+    import tempfile
+    import threading
+    import loaders
+    
+    saved_dir = loaders.GRID_CACHE_DIR
+    stats = {"series": {"count": 4}, "game": {"count": 9, "wins": [{"value": True, "percentage": 55.6}]}}
+    
+    class StubResponse:
+        def __init__(self, status_code, body=None):
+            self.status_code = status_code
+            self.content = json.dumps(body).encode() if body is not None else b""
+            self.headers = {}
+        
+        def raise_for_status(self):
+            if self.status_code >= 400:
+                raise RuntimeError(f"HTTP {self.status_code}")
+    
+    class StubSession:
+        def __init__(self):
+            self.requested = []
+            self.lock = threading.Lock()
+        
+        def post(self, url, data=None, headers=None, timeout=None):
+            team_id = json.loads(data)["variables"]["teamId"]
+            with self.lock:
+                self.requested.append(team_id)
+            if team_id == "99":
+                return StubResponse(500)
+            return StubResponse(200, {"data": {"teamStatistics": stats}})
+    
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            loaders.GRID_CACHE_DIR = cache_dir
+            loaders._get_stats_cache.cache_clear()
+            loaders._STATS_MEMORY_CACHE.clear()
+            loader = loaders.GridDataLoader(api_key="test-key", use_mock=False)
+            loader._session = StubSession()
+            
+            pairs = [("TeamID:83", "lol"), ("TeamID:99", "lol"), ("TeamID:83", "valorant"), ("Cloud9", "lol")]
+            results = loader.load_many(pairs, num_matches=5)
+            assert set(results) == set(pairs) and all(len(matches) == 5 for matches in results.values())
+            print("  ✅ Every pair loaded, failures and names falling back to mock data")
+            
+            # 83 once per game and 99 once: the failed prefetch is not retried
+            assert sorted(loader._session.requested) == ["83", "83", "99"]
+            print("  ✅ One statistics request per team, none repeated after a failure")
+            
+            # Unchanged statistics rebuild the same matches (dates are relative to now)
+            undated = lambda matches: [{**match, "date": None} for match in matches]
+            reloaded = loader.load_many(pairs[:1], num_matches=5)[pairs[0]]
+            assert undated(reloaded) == undated(results[pairs[0]])
+            print("  ✅ Reloading unchanged statistics gives the same matches")
+            
+            cache = loaders._get_stats_cache()
+            if cache is not None:
+                cache.close()
+        
+        return True
+    except Exception as e:
+        print(f"  ❌ Error: {e!r}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        loaders.GRID_CACHE_DIR = saved_dir
+        loaders._get_stats_cache.cache_clear()
+        loaders._STATS_MEMORY_CACHE.clear()
+
+
 def test_agent():
     """Test AI agent (mock mode)"""
     print("\n🤖 Testing AI agent...")
@@ -120,6 +345,366 @@ def test_agent():
         return False
 
 
+def test_prompt_size():
+    """Test that the compact prompt stays well under the verbose one's token count"""
+    print("\n✂️  Testing prompt size...")
+    
+    try:
+        from mock_data import get_lol_mock_data, get_valorant_mock_data
+        from analyzers import analyze_lol_team, analyze_valorant_team
+        from agent import _build_scout_prompt, _estimate_tokens
+        
+        for game_type, matches, analyze in (
+            ("lol", get_lol_mock_data(num_matches=10), analyze_lol_team),
+            ("valorant", get_valorant_mock_data(num_matches=10), analyze_valorant_team),
+        ):
+            stats = analyze(matches)
+            # Token counts are the chars/4 estimate, not a provider tokenizer
+            compact = _estimate_tokens(_build_scout_prompt(stats, game_type))
+            verbose = _estimate_tokens(_build_scout_prompt(stats, game_type, verbose_prompt=True))
+            assert compact < 0.6 * verbose, f"{game_type}: {compact} vs {verbose} tokens"
+            print(f"  ✅ {game_type}: ~{compact} tokens, {compact / verbose:.0%} of the verbose prompt")
+        
+        return True
+    except Exception as e:
+        print(f"  ❌ Error: {e!r}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_report_cache():
+    """Test the on-disk report cache: clean reports are reused, failed streams are not"""
+    print("\n💾 Testing report cache...")
+    
+    import tempfile
+    import agent
+    
+    saved_dir = agent.REPORT_CACHE_DIR
+    saved_providers = dict(agent._PROVIDERS)
+    saved_stream_providers = dict(agent._STREAM_PROVIDERS)
+    calls = []
+    
+    def fake_call(prompt, model=None):
+        calls.append(prompt)
+        return "## Full report"
+    
+    def failing_stream(prompt, model=None):
+        yield "## Partial report "
+        yield agent._StreamError("⚠️ ERROR calling Gemini: connection reset")
+    
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            agent.REPORT_CACHE_DIR = cache_dir
+            agent._get_report_cache.cache_clear()
+            if agent._get_report_cache() is None:
+                print("  ⚠️  diskcache not installed, skipping")
+                return True
+            
+            agent._PROVIDERS["gemini"] = fake_call
+            agent._STREAM_PROVIDERS["gemini"] = failing_stream
+            keys = {"gemini": "test-key"}
+            stats = {"team_name": "Cache Test", "win_rate": 55.0}
+            
+            # A stream that fails partway must not be served to later calls
+            streamed = agent.collect(agent.generate_scouting_report(stats, "lol", "gemini", stream=True, api_keys=keys))
+            assert "⚠️ ERROR" in streamed
+            assert agent.generate_scouting_report(stats, "lol", "gemini", api_keys=keys) == "## Full report"
+            assert len(calls) == 1
+            print("  ✅ Failed stream not cached")
+            
+            assert agent.generate_scouting_report(stats, "lol", "gemini", api_keys=keys) == "## Full report"
+            assert len(calls) == 1
+            print("  ✅ Identical stats hit the cache")
+            
+            agent.generate_scouting_report({**stats, "win_rate": 60.0}, "lol", "gemini", api_keys=keys)
+            assert len(calls) == 2
+            print("  ✅ Changed stats miss the cache")
+            
+            agent._get_report_cache().close()
+        
+        return True
+    except Exception as e:
+        print(f"  ❌ Error: {e!r}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        agent.REPORT_CACHE_DIR = saved_dir
+        agent._PROVIDERS.update(saved_providers)
+        agent._STREAM_PROVIDERS.update(saved_stream_providers)
+        agent._get_report_cache.cache_clear()
+
+
+def test_batched_reports():
+    """Test batched report generation: clean splits, fallback on a short split, and caching"""
+    print("\n📦 Testing batched reports...")
+    
+    import re
+    import tempfile
+    import agent
+    
+    saved_dir = agent.REPORT_CACHE_DIR
+    saved_providers = dict(agent._PROVIDERS)
+    calls = {"batch": 0, "single": 0}
+    short_split = []
+    
+    def fake_call(prompt, model=None, max_tokens=None):
+        teams = re.findall(r'"team_name":"([^"]+)"', prompt)
+        if "TEAM 1 STATISTICS" not in prompt:
+            calls["single"] += 1
+            return f"## Single report: {teams[0]}"
+        calls["batch"] += 1
+        reports = [f"## Batch report: {team}" for team in teams]
+        if short_split:
+            reports = reports[:-1]
+        return f"\n{agent.REPORT_DELIMITER}\n".join(reports)
+    
+    token = agent._API_KEYS.set({"gemini": "test-key"})
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            agent.REPORT_CACHE_DIR = cache_dir
+            agent._get_report_cache.cache_clear()
+            agent._PROVIDERS["gemini"] = fake_call
+            
+            stats_list = [{"team_name": name, "win_rate": 50.0} for name in ("Alpha", "Bravo", "Charlie")]
+            reports = agent.generate_scouting_reports_batched(stats_list, "lol", "gemini")
+            assert reports == [f"## Batch report: {stats['team_name']}" for stats in stats_list]
+            assert calls == {"batch": 1, "single": 0}
+            print("  ✅ One request, split back into per-team reports in order")
+            
+            # One report short: every team in the group falls back to its own call
+            short_split.append(True)
+            stats_list = [{"team_name": name, "win_rate": 50.0} for name in ("Delta", "Echo", "Foxtrot")]
+            reports = agent.generate_scouting_reports_batched(stats_list, "lol", "gemini")
+            assert reports == [f"## Single report: {stats['team_name']}" for stats in stats_list]
+            assert calls == {"batch": 2, "single": 3}
+            print("  ✅ Short split falls back to single-team calls")
+            
+            if agent._get_report_cache() is None:
+                print("  ⚠️  diskcache not installed, skipping cache check")
+                return True
+            report = agent.generate_scouting_report({"team_name": "Bravo", "win_rate": 50.0}, "lol", "gemini")
+            assert report == "## Batch report: Bravo"
+            assert calls == {"batch": 2, "single": 3}
+            print("  ✅ Batched report served from cache to a later single-team call")
+            
+            agent._get_report_cache().close()
+        
+        return True
+    except Exception as e:
+        print(f"  ❌ Error: {e!r}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        agent._API_KEYS.reset(token)
+        agent.REPORT_CACHE_DIR = saved_dir
+        agent._PROVIDERS.update(saved_providers)
+        agent._get_report_cache.cache_clear()
+
+
+def test_openai_batch_client():
+    """Test that a scout_teams_batch run shares one AsyncOpenAI client per key and closes it"""
+    print("\n🔌 Testing batch client reuse...")
+    
+    import tempfile
+    import types
+    import agent
+    
+    saved_dir = agent.REPORT_CACHE_DIR
+    saved_client_cls = agent.AsyncOpenAI
+    clients = []
+    
+    class FakeAsyncOpenAI:
+        def __init__(self, api_key=None, **kwargs):
+            self.api_key = api_key
+            self.requests = 0
+            self.closed = False
+            self.chat = types.SimpleNamespace(completions=types.SimpleNamespace(create=self._create))
+            clients.append(self)
+        
+        async def _create(self, **kwargs):
+            self.requests += 1
+            message = types.SimpleNamespace(content=f"## Report {self.requests}")
+            return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+        
+        async def close(self):
+            self.closed = True
+        
+        async def __aenter__(self):
+            return self
+        
+        async def __aexit__(self, *exc_info):
+            await self.close()
+    
+    token = agent._API_KEYS.set({"openai": "test-key"})
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            agent.REPORT_CACHE_DIR = cache_dir
+            agent._get_report_cache.cache_clear()
+            agent.AsyncOpenAI = FakeAsyncOpenAI
+            
+            stats_list = [{"team_name": name, "win_rate": 50.0} for name in ("Alpha", "Bravo", "Charlie")]
+            reports = agent.scout_teams_batch(stats_list, "lol", "openai")
+            assert all(report.startswith("## Report") for report in reports), reports
+            assert len(clients) == 1 and clients[0].requests == 3 and clients[0].closed
+            print("  ✅ Three reports over one client, closed after the batch")
+            
+            cache = agent._get_report_cache()
+            if cache is not None:
+                cache.close()
+        
+        return True
+    except Exception as e:
+        print(f"  ❌ Error: {e!r}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        agent._API_KEYS.reset(token)
+        agent.REPORT_CACHE_DIR = saved_dir
+        agent.AsyncOpenAI = saved_client_cls
+        agent._get_report_cache.cache_clear()
+
+
+def test_api_key_scoping():
+    """Test that explicit API keys reach the provider but never leak past the call"""
+    print("\n🔑 Testing API key scoping...")
+    
+    import asyncio
+    import tempfile
+    import agent
+    
+    saved_dir = agent.REPORT_CACHE_DIR
+    saved_providers = dict(agent._PROVIDERS)
+    saved_stream_providers = dict(agent._STREAM_PROVIDERS)
+    saved_async_providers = dict(agent._ASYNC_PROVIDERS)
+    
+    def key_call(prompt, model=None):
+        return f"key={agent._provider_api_key('gemini')}"
+    
+    def key_stream(prompt, model=None):
+        yield f"key={agent._provider_api_key('gemini')}"
+    
+    async def key_call_async(prompt, model=None):
+        return key_call(prompt, model)
+    
+    async def run_async(stats):
+        report = await agent.generate_scouting_report_async(stats, "lol", "gemini", api_keys={"gemini": "async-key"})
+        return report, agent._API_KEYS.get()
+    
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            agent.REPORT_CACHE_DIR = cache_dir
+            agent._get_report_cache.cache_clear()
+            agent._PROVIDERS["gemini"] = key_call
+            agent._STREAM_PROVIDERS["gemini"] = key_stream
+            agent._ASYNC_PROVIDERS["gemini"] = key_call_async
+            
+            report = agent.generate_scouting_report({"team_name": "Sync"}, "lol", "gemini", api_keys={"gemini": "sync-key"})
+            assert report == "key=sync-key" and agent._API_KEYS.get() is None
+            print("  ✅ Sync call sees its key, caller context untouched")
+            
+            # The stream is consumed after the call returns, as main.py's worker does
+            chunks = agent.generate_scouting_report({"team_name": "Stream"}, "lol", "gemini", stream=True,
+                                                    api_keys={"gemini": "stream-key"})
+            assert agent.collect(chunks) == "key=stream-key" and agent._API_KEYS.get() is None
+            print("  ✅ Streamed call keeps its key while consumed")
+            
+            report, leaked = asyncio.run(run_async({"team_name": "Async"}))
+            assert report == "key=async-key" and leaked is None
+            print("  ✅ Awaited async call doesn't leak its key")
+            
+            cache = agent._get_report_cache()
+            if cache is not None:
+                cache.close()
+        
+        return True
+    except Exception as e:
+        print(f"  ❌ Error: {e!r}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        agent.REPORT_CACHE_DIR = saved_dir
+        agent._PROVIDERS.update(saved_providers)
+        agent._STREAM_PROVIDERS.update(saved_stream_providers)
+        agent._ASYNC_PROVIDERS.update(saved_async_providers)
+        agent._get_report_cache.cache_clear()
+
+
+def test_gemini_key_isolation():
+    """Test that concurrent Gemini calls with different keys never swap credentials"""
+    print("\n🔐 Testing Gemini key isolation...")
+    
+    import tempfile
+    import threading
+    import types
+    import agent
+    
+    saved_dir = agent.REPORT_CACHE_DIR
+    saved_import = agent._import_glm
+    second_client_ready = threading.Event()
+    
+    class FakeClient:
+        def __init__(self, client_options=None):
+            self.api_key = client_options["api_key"]
+            if self.api_key == "key-b":
+                second_client_ready.set()
+        
+        def generate_content(self, request, timeout=None):
+            # Hold the first call open until the second key's client exists
+            if self.api_key == "key-a":
+                second_client_ready.wait(timeout=5)
+            part = types.SimpleNamespace(text=f"key={self.api_key}")
+            return types.SimpleNamespace(candidates=[types.SimpleNamespace(content=types.SimpleNamespace(parts=[part]))])
+    
+    fake_glm = types.SimpleNamespace(
+        GenerativeServiceClient=FakeClient,
+        GenerateContentRequest=types.SimpleNamespace,
+        Content=types.SimpleNamespace,
+        Part=types.SimpleNamespace,
+        GenerationConfig=types.SimpleNamespace
+    )
+    
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            agent.REPORT_CACHE_DIR = cache_dir
+            agent._get_report_cache.cache_clear()
+            agent._get_gemini_client.cache_clear()
+            agent._import_glm = lambda: fake_glm
+            
+            reports = {}
+            
+            def scout(name, key):
+                reports[name] = agent.generate_scouting_report({"team_name": name}, "lol", "gemini",
+                                                               api_keys={"gemini": key})
+            
+            first = threading.Thread(target=scout, args=("A", "key-a"))
+            first.start()
+            scout("B", "key-b")
+            first.join()
+            assert reports == {"A": "key=key-a", "B": "key=key-b"}, reports
+            print("  ✅ Each concurrent call used its own key")
+            
+            cache = agent._get_report_cache()
+            if cache is not None:
+                cache.close()
+        
+        return True
+    except Exception as e:
+        print(f"  ❌ Error: {e!r}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        agent.REPORT_CACHE_DIR = saved_dir
+        agent._import_glm = saved_import
+        agent._get_report_cache.cache_clear()
+        agent._get_gemini_client.cache_clear()
+
+
 def main():
     """Run all tests"""
     print("=" * 60)
@@ -131,7 +716,17 @@ def main():
     results.append(("Imports", test_imports()))
     results.append(("Mock Data", test_mock_data()))
     results.append(("Analyzers", test_analyzers()))
+    results.append(("Columnar Analysis", test_columnar_analysis()))
+    results.append(("Analysis Cache", test_analysis_cache()))
+    results.append(("Stats Revalidation", test_stats_revalidation()))
+    results.append(("Load Many", test_load_many()))
     results.append(("AI Agent", test_agent()))
+    results.append(("Prompt Size", test_prompt_size()))
+    results.append(("Report Cache", test_report_cache()))
+    results.append(("Batched Reports", test_batched_reports()))
+    results.append(("Batch Client Reuse", test_openai_batch_client()))
+    results.append(("API Key Scoping", test_api_key_scoping()))
+    results.append(("Gemini Key Isolation", test_gemini_key_isolation()))
     
     print("\n" + "=" * 60)
     print("📋 TEST SUMMARY")
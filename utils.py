@@ -3,9 +3,22 @@ Utility functions for visualization and data processing
 """
 import plotly.graph_objects as go
 import plotly.express as px
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import pandas as pd
 import numpy as np
+from columns import LolMatchColumns, build_lol_columns
+
+HEATMAP_BINS = 30  # Bins per axis for the jungle heatmap
+
+# Stat card markup, kept on one line so it stays a single HTML block inside markdown
+_STAT_CARD_HTML = (
+    '<div style="background: linear-gradient(135deg, #1a1d23 0%, #2d3139 100%); border-left: 4px solid {color}; '
+    'padding: 20px; border-radius: 8px; margin: 10px 0; box-shadow: 0 4px 6px rgba(0,0,0,0.3);">'
+    '<h3 style="margin:0; color:#8b8d98; font-size:14px; font-weight:400;">{title}</h3>'
+    '<p style="margin:10px 0 5px 0; color:{color}; font-size:36px; font-weight:700;">{value}</p>'
+    '{subtitle}</div>'
+)
+_STAT_CARD_SUBTITLE_HTML = '<p style="margin:0; color:#8b8d98; font-size:12px;">{}</p>'
 
 
 def create_jungle_heatmap(heatmap_data: Dict[str, List]) -> go.Figure:
@@ -13,16 +26,15 @@ def create_jungle_heatmap(heatmap_data: Dict[str, List]) -> go.Figure:
     Create an interactive heatmap of jungle proximity
     
     Args:
-        heatmap_data: Dictionary with 'x', 'y', and 'lane' lists
+        heatmap_data: Dictionary with 'x' and 'y' coordinate arrays (or lists)
         
     Returns:
         Plotly figure object
     """
     x_coords = heatmap_data.get("x", [])
     y_coords = heatmap_data.get("y", [])
-    lanes = heatmap_data.get("lane", [])
     
-    if not x_coords:
+    if len(x_coords) == 0:
         # Return empty figure
         fig = go.Figure()
         fig.add_annotation(
@@ -33,14 +45,15 @@ def create_jungle_heatmap(heatmap_data: Dict[str, List]) -> go.Figure:
         )
         return fig
     
-    # Create density heatmap
-    fig = go.Figure(data=go.Histogram2d(
-        x=x_coords,
-        y=y_coords,
+    # Bin here so the browser receives a HEATMAP_BINS x HEATMAP_BINS grid, not every sample
+    counts, x_edges, y_edges = np.histogram2d(x_coords, y_coords, bins=HEATMAP_BINS)
+    fig = go.Figure(data=go.Heatmap(
+        x=(x_edges[:-1] + x_edges[1:]) / 2,
+        y=(y_edges[:-1] + y_edges[1:]) / 2,
+        z=counts.T,
         colorscale='Hot',
         reversescale=True,
-        nbinsx=30,
-        nbinsy=30
+        hovertemplate='X: %{x:.0f}<br>Y: %{y:.0f}<br>Samples: %{z:.0f}<extra></extra>'
     ))
     
     fig.update_layout(
@@ -138,27 +151,32 @@ def create_objective_timeline(matches: List[Dict[str, Any]], team_name: str) ->
     return fig
 
 
-def create_gold_diff_chart(matches: List[Dict[str, Any]]) -> go.Figure:
+def create_gold_diff_chart(matches: List[Dict[str, Any]],
+                           columns: Optional[LolMatchColumns] = None) -> go.Figure:
     """
     Create line chart showing gold difference over time
     
     Args:
         matches: List of match dictionaries
+        columns: Columnar view of matches, when the caller has already built it
         
     Returns:
         Plotly figure object
     """
     fig = go.Figure()
     
-    for match_idx, match in enumerate(matches):
-        gold_updates = match.get("gold_updates", [])
-        
-        if gold_updates:
-            timestamps = [update["timestamp"] / 60 for update in gold_updates]
-            gold_diffs = [update["gold_difference"] for update in gold_updates]
-            
+    if columns is None:
+        columns = build_lol_columns(matches)
+    
+    # Per-match views into the flat gold arrays
+    bounds = np.cumsum(columns.gold_counts)[:-1]
+    match_minutes = np.split(columns.gold_timestamp / 60, bounds)
+    match_gold_diffs = np.split(columns.gold_difference, bounds)
+    
+    for match_idx, (won, timestamps, gold_diffs) in enumerate(zip(columns.won.tolist(), match_minutes, match_gold_diffs)):
+        if timestamps.size:
             match_label = f"Match {match_idx + 1}"
-            line_color = '#00ff00' if match.get("won", False) else '#ff0000'
+            line_color = '#00ff00' if won else '#ff0000'
             
             fig.add_trace(go.Scatter(
                 x=timestamps,
@@ -313,20 +331,12 @@ def format_stat_card(title: str, value: str, subtitle: str = "", color: str = "#
     Returns:
         HTML string
     """
-    return f"""
-    <div style="
-        background: linear-gradient(135deg, #1a1d23 0%, #2d3139 100%);
-        border-left: 4px solid {color};
-        padding: 20px;
-        border-radius: 8px;
-        margin: 10px 0;
-        box-shadow: 0 4px 6px rgba(0,0,0,0.3);
-    ">
-        <h3 style="margin:0; color:#8b8d98; font-size:14px; font-weight:400;">{title}</h3>
-        <p style="margin:10px 0 5px 0; color:{color}; font-size:36px; font-weight:700;">{value}</p>
-        {f'<p style="margin:0; color:#8b8d98; font-size:12px;">{subtitle}</p>' if subtitle else ''}
-    </div>
-    """
+    return _STAT_CARD_HTML.format(
+        title=title,
+        value=value,
+        color=color,
+        subtitle=_STAT_CARD_SUBTITLE_HTML.format(subtitle) if subtitle else ""
+    )
 
 
 def get_color_by_performance(value: float, threshold_good: float, threshold_bad: float, 